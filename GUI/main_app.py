@@ -593,8 +593,8 @@ class GaugeApplication:
         Args:
             config (dict): Simulation configuration options.
         """
-        if self.communicator and hasattr(self.communicator, "config"):
-            self.communicator.config.update(config)
+        if self.communicator and hasattr(self.communicator, "update_config"):
+            self.communicator.update_config(config)
             self.log_message(f"Simulation configuration updated: {config}", level="INFO")
         else:
             self.log_message("No simulator active; configuration not applied.", level="ERROR")
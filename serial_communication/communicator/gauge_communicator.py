@@ -5,19 +5,33 @@ Implements the GaugeCommunicator class that manages serial communication,
 command creation, response parsing, and continuous reading for vacuum gauges.
 """
 
+import sys
 import time
 import logging
+from array import array
 from typing import Optional
 import serial
+from serial.rs485 import RS485Settings
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows, where pyserial has no native RS485 mode.
+    fcntl = None
 
 from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
 from serial_communication.gauges.protocols.ppg_protocol import PPGProtocol
 from serial_communication.communicator.intelligent_command_sender import IntelligentCommandSender
 from serial_communication.communicator.response_handler import ResponseHandler
-from serial_communication.config import GAUGE_PARAMETERS, GAUGE_OUTPUT_FORMATS, OUTPUT_FORMATS
+from serial_communication.config import (
+    GAUGE_PARAMETERS, GAUGE_OUTPUT_FORMATS, GAUGE_SERIAL_KWARGS, OUTPUT_FORMATS_SET
+)
 from serial_communication.models import GaugeCommand, GaugeResponse
 from serial_communication.communicator.protocol_factory import get_protocol
 
+# Linux TIOCSRS485 ioctl; struct serial_rs485 is eight 32-bit words, flags first.
+# An all-zero struct clears SER_RS485_ENABLED.
+_TIOCSRS485 = 0x542F
+
 
 class GaugeCommunicator:
     """
@@ -34,6 +48,9 @@ class GaugeCommunicator:
             logger: Optional logger for debugging.
         """
         self.port = port
+        # Gauge names arrive from the GUI as fresh strings; interning them makes the
+        # config table lookups hit the identity fast path of the interned keys.
+        gauge_type = sys.intern(gauge_type)
         self.gauge_type = gauge_type
         self.logger = logger or logging.getLogger(__name__)
         self.ser: Optional[serial.Serial] = None
@@ -48,12 +65,13 @@ class GaugeCommunicator:
         self.logger.debug(f"Initialized {gauge_type} communicator with output format: {initial_format}")
 
     def _init_serial_settings(self) -> None:
-        self.baudrate = self.params["baudrate"]
-        self.bytesize = self.params.get("bytesize", serial.EIGHTBITS)
-        self.parity = self.params.get("parity", serial.PARITY_NONE)
-        self.stopbits = self.params.get("stopbits", serial.STOPBITS_ONE)
-        self.timeout = self.params.get("timeout", 2)
-        self.write_timeout = self.params.get("write_timeout", 2)
+        settings = GAUGE_SERIAL_KWARGS[self.gauge_type]
+        self.baudrate = settings["baudrate"]
+        self.bytesize = settings["bytesize"]
+        self.parity = settings["parity"]
+        self.stopbits = settings["stopbits"]
+        self.timeout = settings["timeout"]
+        self.write_timeout = settings["write_timeout"]
 
     def _init_communication_modes(self) -> None:
         self.rs_mode = "RS232"
@@ -61,6 +79,12 @@ class GaugeCommunicator:
         self.continuous_output = (self.gauge_type == "CDG045D")
         self.continuous_reading = False
         self._stop_continuous = False
+        # True after an exchange whose reply was read completely; the manual command
+        # sender then skips its pre-write flush if no new input has arrived.
+        self.buffers_clean = False
+        self._rs485_native = False
+        self._rs485_unsupported = False
+        self.rs485_config: Optional[RS485Settings] = None
         self.rts_level_for_tx = True
         self.rts_level_for_rx = False
         self.rts_delay_before_tx = 0.002
@@ -75,16 +99,7 @@ class GaugeCommunicator:
             True if the connection test is successful, False otherwise.
         """
         try:
-            self.ser = serial.Serial(
-                port=self.port,
-                baudrate=self.baudrate,
-                bytesize=self.bytesize,
-                parity=self.parity,
-                stopbits=self.stopbits,
-                timeout=self.timeout,
-                write_timeout=self.write_timeout
-            )
-            self.set_rs_mode(self.rs_mode)
+            self.open_port()
             self.disable_validation()
             connection_result = self.test_connection()
             if connection_result:
@@ -95,6 +110,25 @@ class GaugeCommunicator:
             self.disconnect()
             return False
 
+    def open_port(self) -> None:
+        """
+        Opens the serial port with the configured settings and applies the RS mode,
+        without running a connection test.
+        """
+        self.ser = serial.Serial(
+            port=self.port,
+            baudrate=self.baudrate,
+            bytesize=self.bytesize,
+            parity=self.parity,
+            stopbits=self.stopbits,
+            timeout=self.timeout,
+            write_timeout=self.write_timeout
+        )
+        self.buffers_clean = False
+        self._rs485_native = False
+        self._rs485_unsupported = False
+        self.set_rs_mode(self.rs_mode)
+
     def detect_gauge(self) -> Optional[str]:
         """
         If the gauge type is generic ("CDGxxxD"), attempts to detect the exact model.
@@ -110,7 +144,7 @@ class GaugeCommunicator:
             if response.success and response.raw_data:
                 detected_type = self.protocol.detect_gauge_type(response.raw_data)
                 if detected_type:
-                    self.gauge_type = detected_type
+                    self.gauge_type = sys.intern(detected_type)
                     self.params = GAUGE_PARAMETERS[self.gauge_type]
                     self.protocol = get_protocol(self.gauge_type, self.params)
                     self.logger.info(f"Detected gauge type: {detected_type}")
@@ -258,7 +292,7 @@ class GaugeCommunicator:
         Args:
             format_type: The desired output format.
         """
-        if format_type not in OUTPUT_FORMATS:
+        if format_type not in OUTPUT_FORMATS_SET:
             self.logger.error(f"Invalid output format: {format_type}")
             return
         self.output_format = format_type
@@ -308,11 +342,58 @@ class GaugeCommunicator:
             if mode == "RS485":
                 self.ser.setDTR(True)
                 self.ser.setRTS(False)
+                # The driver keeps the RS485 settings until the port is reopened, and a
+                # driver that rejected them once is not asked again for this port.
+                if not self._rs485_native and not self._rs485_unsupported:
+                    self._enable_native_rs485()
             else:
+                if self._rs485_native:
+                    self._disable_native_rs485()
                 self.ser.setDTR(True)
                 self.ser.setRTS(True)
         return True
 
+    def _enable_native_rs485(self) -> None:
+        """
+        Hands RS485 direction control to the serial driver (TIOCSRS485 on Linux)
+        so RTS is switched around each write without Python-side toggling.
+        Falls back to manual RTS control when the driver does not support it.
+        """
+        self.rs485_config = RS485Settings(
+            rts_level_for_tx=self.rts_level_for_tx,
+            rts_level_for_rx=self.rts_level_for_rx,
+            delay_before_tx=self.rts_delay_before_tx,
+            delay_before_rx=self.rts_delay_before_rx
+        )
+        try:
+            self.ser.rs485_mode = self.rs485_config
+            self._rs485_native = True
+        except (ValueError, OSError, NotImplementedError) as e:
+            self._rs485_native = False
+            self._rs485_unsupported = True
+            # The driver rejected TIOCSRS485, so the UART is unchanged; only pyserial's
+            # stored copy needs clearing, or it would retry the ioctl on every later
+            # reconfiguration (e.g. a baud rate change).
+            try:
+                self.ser.rs485_mode = None
+            except (ValueError, OSError, NotImplementedError):
+                pass
+            self.logger.debug(f"Native RS485 mode unavailable, using manual RTS control: {str(e)}")
+
+    def _disable_native_rs485(self) -> None:
+        """
+        Turns the driver's RS485 mode off. Setting rs485_mode to None only stops pyserial
+        from re-applying the settings; the UART keeps SER_RS485_ENABLED until it is
+        cleared with TIOCSRS485, so that is done explicitly first.
+
+        Raises:
+            OSError: If the driver rejects the ioctl; native mode is then still recorded as active.
+        """
+        if fcntl is not None:
+            fcntl.ioctl(self.ser.fileno(), _TIOCSRS485, array('I', [0] * 8))
+        self.ser.rs485_mode = None
+        self._rs485_native = False
+
     def set_continuous_reading(self, enabled: bool) -> None:
         """
         Enables or disables continuous reading mode.
@@ -322,6 +403,7 @@ class GaugeCommunicator:
         """
         self.continuous_reading = enabled
         self._stop_continuous = not enabled
+        self.buffers_clean = False
         self.logger.debug(f"Continuous reading {'enabled' if enabled else 'disabled'}")
 
     def stop_continuous_reading(self) -> None:
@@ -393,20 +475,16 @@ class GaugeCommunicator:
         response = bytearray()
         start_time = time.time()
         while (time.time() - start_time) < self.timeout:
-            if self.ser.in_waiting:
-                byte = self.ser.read(1)
-                response += byte
-                if response.endswith(terminator):
-                    return bytes(response)
-                # Special handling for certain error responses (e.g., PPG '@NAK...')
-                if response.startswith(b'@NAK'):
-                    while not response.endswith(b'\\'):
-                        if self.ser.in_waiting:
-                            response += self.ser.read(1)
-                    return bytes(response)
+            waiting = self.ser.in_waiting
+            if waiting:
+                response += self.ser.read(waiting)
+                end = response.find(terminator)
+                if end != -1:
+                    return bytes(response[:end + len(terminator)])
+            # Error responses (e.g., PPG '@NAK...') are always read up to the terminator.
+            elif response and not response.startswith(b'@NAK'):
+                return bytes(response)
             else:
-                if response:
-                    return bytes(response)
                 time.sleep(0.01)
         return bytes(response) if response else None
 
@@ -421,8 +499,9 @@ class GaugeCommunicator:
         response = bytearray()
         start_time = time.time()
         while (time.time() - start_time) < self.timeout:
-            if self.ser.in_waiting:
-                response += self.ser.read(1)
+            waiting = self.ser.in_waiting
+            if waiting:
+                response += self.ser.read(waiting)
             else:
                 if response:
                     return bytes(response)
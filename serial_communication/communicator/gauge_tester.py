@@ -12,6 +12,30 @@ from serial_communication.models import GaugeCommand, GaugeResponse
 from serial_communication.config import GAUGE_PARAMETERS
 from serial_communication.communicator.gauge_communicator import GaugeCommunicator
 from serial_communication.communicator.intelligent_command_sender import IntelligentCommandSender
+from serial_communication.gauges.protocols.cdg_protocol import CDGProtocol
+from serial_communication.gauges.protocols.ppg_protocol import PPGProtocol
+
+# Gauges speaking the binary Pfeiffer PID protocol.
+_PFEIFFER_BINARY_GAUGES = ("PCG550", "PSG550", "MAG500", "MPG500")
+
+
+def _build_pfeiffer_binary(cmd_name: str, cmd_info: dict) -> GaugeCommand:
+    """Builds a read command addressed by PID for the binary Pfeiffer gauges."""
+    return GaugeCommand(
+        name=cmd_name,
+        command_type="?",
+        parameters={"pid": cmd_info["pid"], "cmd": cmd_info["cmd"]}
+    )
+
+
+def _build_ppg550(cmd_name: str, cmd_info: dict) -> GaugeCommand:
+    """Builds a read command named by its ASCII mnemonic for the PPG550."""
+    return GaugeCommand(name=cmd_info["cmd"], command_type="?")
+
+
+def _build_default(cmd_name: str, cmd_info: dict) -> GaugeCommand:
+    """Builds a command from the config name and command type (e.g., CDG gauges)."""
+    return GaugeCommand(name=cmd_info.get("name", cmd_name), command_type=cmd_info["cmd"])
 
 
 class GaugeTester:
@@ -19,6 +43,12 @@ class GaugeTester:
     Tests gauge communication by attempting different commands and baud rates.
     """
 
+    # GaugeCommand builder per gauge type; anything else uses _build_default.
+    _BUILDERS = {
+        **{gauge: _build_pfeiffer_binary for gauge in _PFEIFFER_BINARY_GAUGES},
+        "PPG550": _build_ppg550,
+    }
+
     def __init__(self, communicator: GaugeCommunicator, logger):
         """
         Initializes the tester.
@@ -42,7 +72,7 @@ class GaugeTester:
             A dictionary mapping command names to their definitions.
         """
         commands = {}
-        if self.gauge_type in ["PCG550", "PSG550", "MAG500", "MPG500"]:
+        if self.gauge_type in _PFEIFFER_BINARY_GAUGES:
             commands.update({
                 "product_name": {"pid": 208, "cmd": 1, "desc": "Read product name"},
                 "software_version": {"pid": 218, "cmd": 1, "desc": "Read software version"},
@@ -93,26 +123,36 @@ class GaugeTester:
             self.logger.error(f"Connection test failed: {str(e)}")
             return False
 
-    def try_all_baud_rates(self, port: str) -> bool:
+    def try_all_baud_rates(self, port: str, timeout_s: float = 10.0, max_attempts: int = 5) -> bool:
         """
         Cycles through candidate baud rates to find one that works.
 
+        The scan is bounded both in attempts and in wall time so a dead port or a
+        bad cable cannot block the caller indefinitely.
+
         Args:
             port: The serial port to test.
+            timeout_s: Overall time budget in seconds for the scan.
+            max_attempts: Maximum number of baud rates to try.
 
         Returns:
             True if a baud rate is found that passes the connection test, False otherwise.
         """
-        from serial_communication.config import BAUD_RATES
-
         baud_rates = [
             self.params.get("baudrate", 9600),
             57600, 38400, 19200, 9600
         ]
         baud_rates = list(dict.fromkeys(baud_rates))
+        deadline = time.monotonic() + timeout_s
+        attempts = 0
         self.logger.info("\n=== Testing Baud Rates ===")
         for baud in baud_rates:
+            if attempts >= max_attempts or time.monotonic() > deadline:
+                self.logger.info("\nBaud rate scan budget exhausted")
+                break
+            attempts += 1
             self.logger.info(f"\nTrying baud rate: {baud}")
+            temp_communicator = None
             try:
                 temp_communicator = GaugeCommunicator(
                     port=port,
@@ -120,21 +160,85 @@ class GaugeTester:
                     logger=self.logger
                 )
                 temp_communicator.baudrate = baud
-                if temp_communicator.connect():
-                    if self.test_connection():
-                        self.logger.info(f"Successfully connected at {baud} baud!")
-                        temp_communicator.disconnect()
-                        return True
-                    else:
-                        self.logger.debug(f"Connection test failed at {baud} baud")
-                if temp_communicator.ser and temp_communicator.ser.is_open:
-                    temp_communicator.disconnect()
+                temp_communicator.open_port()
+                if self._probe_connection(temp_communicator):
+                    self.logger.info(f"Successfully connected at {baud} baud!")
+                    return True
+                self.logger.debug(f"Connection test failed at {baud} baud")
             except Exception as e:
                 self.logger.error(f"Failed at {baud} baud: {str(e)}")
-            time.sleep(0.5)
+            finally:
+                if temp_communicator and temp_communicator.ser and temp_communicator.ser.is_open:
+                    temp_communicator.disconnect()
+            time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
         self.logger.info("\nFailed to connect at any baud rate")
         return False
 
+    def _probe_connection(self, communicator: GaugeCommunicator) -> bool:
+        """
+        Sends the protocol test commands on an open port and waits briefly for a
+        plausible reply, so a wrong baud rate is rejected without a full read timeout.
+
+        Args:
+            communicator: A communicator whose port is already open.
+
+        Returns:
+            True if any test command gets a plausible response, otherwise False.
+        """
+        ser = communicator.ser
+        for cmd_bytes in communicator.protocol.test_commands():
+            ser.reset_input_buffer()
+            ser.write(cmd_bytes)
+            ser.flush()
+            response = self._fast_probe_read(ser, communicator.protocol)
+            if response:
+                self.logger.debug(f"Probe response: {response.hex(' ')}")
+                return True
+        return False
+
+    def _fast_probe_read(self, ser, protocol, max_wait: float = 0.2) -> Optional[bytes]:
+        """
+        Polls the port for a reply and gives up as soon as the bytes cannot belong
+        to the gauge protocol (the usual symptom of a baud mismatch).
+
+        Args:
+            ser: The open serial port.
+            protocol: The gauge protocol used to judge the incoming bytes.
+            max_wait: Maximum time in seconds to wait for a reply.
+
+        Returns:
+            The bytes read if they look like a valid reply, otherwise None.
+        """
+        response = bytearray()
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
+            waiting = ser.in_waiting
+            if waiting:
+                response += ser.read(waiting)
+                if not self._is_plausible_response(response, protocol):
+                    return None
+            elif response:
+                return bytes(response)
+            time.sleep(0.01)
+        return bytes(response) if response else None
+
+    @staticmethod
+    def _is_plausible_response(response: bytearray, protocol) -> bool:
+        """
+        Checks the first bytes of a reply against the framing of the protocol.
+
+        ASCII protocols never set the high bit, CDG frames start with 0x07 and the
+        binary Pfeiffer protocols echo their device ID in the second byte.
+        """
+        if isinstance(protocol, PPGProtocol):
+            return max(response) < 0x80
+        if isinstance(protocol, CDGProtocol):
+            return response[0] == 0x07
+        device_id = getattr(protocol, "device_id", None)
+        if device_id is not None and len(response) > 1:
+            return response[1] == device_id
+        return True
+
     def send_enq(self) -> bool:
         """
         Sends an ENQ (0x05) command to verify if the gauge responds.
@@ -189,18 +293,10 @@ class GaugeTester:
             return results
         results["connection"] = True
         results["enq"] = self.send_enq()
+        builder = self._BUILDERS.get(self.gauge_type, _build_default)
         for cmd_name, cmd_info in self.test_commands.items():
             try:
-                if self.gauge_type in ["PCG550", "PSG550", "MAG500", "MPG500"]:
-                    command = GaugeCommand(
-                        name=cmd_name,
-                        command_type="?",
-                        parameters={"pid": cmd_info["pid"], "cmd": cmd_info["cmd"]}
-                    )
-                elif self.gauge_type == "PPG550":
-                    command = GaugeCommand(name=cmd_info["cmd"], command_type="?")
-                else:
-                    command = GaugeCommand(name=cmd_info.get("name", cmd_name), command_type=cmd_info["cmd"])
+                command = builder(cmd_name, cmd_info)
                 cmd_bytes = self.communicator.protocol.create_command(command)
                 result_cmd = IntelligentCommandSender.send_manual_command(
                     self.communicator,
@@ -15,10 +15,107 @@ Usage Example:
         print("Error:", result["error"])
 """
 
+import re
 import time
+from functools import lru_cache
 from typing import Tuple, Dict, Any
+
+try:
+    import termios
+except ImportError:  # Not available on Windows; pyserial's own calls are used instead.
+    termios = None
 from ..config import OUTPUT_FORMATS  # Global list of valid output formats
 
+# Precompiled full-string validators for detect_format (input is already stripped).
+_RE_BIN = re.compile(r'\A[01 ]*\Z')
+# Normalized bit string accepted by convert_to_bytes (int(..., 2) would also take signs and '_').
+_RE_BITS = re.compile(r'\A[01]*\Z')
+_RE_HEX = re.compile(r'\A[0-9A-Fa-f ]+\Z')
+_RE_DEC = re.compile(r'\A\d+(?:\s+\d+)*\Z')
+_RE_DEC_CSV = re.compile(r'\A\d+(?:\s*,\s*\d+)+\Z')
+# Single-pass removal of hex prefixes/escapes and separators. A per-character
+# translate table cannot be used here: deleting 'x' would leave the '0' of "0x".
+_RE_HEX_PREFIX_NOISE = re.compile(r'0[xX]| ')
+_RE_HEX_ESCAPE_NOISE = re.compile(r'\\x| ')
+
+# Printable ASCII plus CR/LF; deleting these from a response leaves only non-text bytes.
+_PRINTABLE = bytes(range(32, 127)) + b'\r\n'
+
+
+def _flush_buffers(ser) -> None:
+    """
+    Discards pending input and output data.
+
+    On POSIX ports both queues are flushed with one tcflush(TCIOFLUSH) call;
+    otherwise pyserial's reset_input_buffer()/reset_output_buffer() are used.
+
+    Args:
+        ser: The open serial port.
+    """
+    if termios is not None:
+        try:
+            termios.tcflush(ser.fileno(), termios.TCIOFLUSH)
+            return
+        except (AttributeError, OSError, ValueError, termios.error):
+            pass
+    ser.reset_input_buffer()
+    ser.reset_output_buffer()
+
+
+# Manual commands are frequently re-sent verbatim (retries, polling), so parsing
+# results are memoized. Both return immutable values and are safe to share.
+@lru_cache(maxsize=256)
+def _detect_format(input_string: str) -> Tuple[str, str]:
+    """Cached implementation of IntelligentCommandSender.detect_format."""
+    input_string = input_string.strip()
+    low = input_string.lower()
+    # Cheap discriminators first: binary, decimal and bare hex can never contain
+    # 'x' or ',', so these checks settle most inputs before any full-string scan.
+    # Check for hex with "0x" prefix
+    if low.startswith('0x') or ' 0x' in low:
+        return "hex_prefixed", _RE_HEX_PREFIX_NOISE.sub("", input_string)
+    # Check for escaped hex (e.g., "\x41\x42")
+    if '\\x' in input_string:
+        return "hex_escaped", _RE_HEX_ESCAPE_NOISE.sub("", input_string)
+    # Check for comma-separated decimals
+    if ',' in input_string:
+        if _RE_DEC_CSV.match(input_string):
+            return "decimal_csv", input_string
+        return "ascii", input_string
+    # Check for binary format: only 0's, 1's, and spaces
+    if _RE_BIN.match(input_string):
+        return "binary", input_string.replace(" ", "")
+    # Check for space-separated decimals
+    if _RE_DEC.match(input_string):
+        return "decimal", input_string
+    # Check for a valid hex string without prefix
+    if _RE_HEX.match(input_string):
+        return "hex", input_string.replace(" ", "")
+    # Otherwise, treat as ASCII
+    return "ascii", input_string
+
+
+@lru_cache(maxsize=256)
+def _convert_to_bytes(format_type: str, input_string: str) -> bytes:
+    """Cached implementation of IntelligentCommandSender.convert_to_bytes."""
+    if format_type == "binary":
+        if not _RE_BITS.match(input_string):
+            raise ValueError(f"Invalid binary string: {input_string!r}")
+        # Pad to a multiple of 8 bits, then convert the whole bit string in one C-level call
+        input_string += '0' * (-len(input_string) % 8)
+        return int(input_string or '0', 2).to_bytes(len(input_string) // 8, 'big')
+    elif format_type in ["hex", "hex_prefixed", "hex_escaped"]:
+        return bytes.fromhex(input_string)
+    elif format_type in ["decimal", "decimal_csv"]:
+        # int() ignores surrounding whitespace, so CSV fields need no strip();
+        # bytes(map(...)) consumes the values without building a list.
+        return bytes(map(int, input_string.split(',') if ',' in input_string else input_string.split()))
+    elif format_type == "ascii":
+        return input_string.encode('ascii')
+    else:
+        raise ValueError(f"Unsupported format: {format_type}")
+
+
 class IntelligentCommandSender:
     """
     Handles the detection and conversion of user command strings into byte sequences.
@@ -37,27 +134,7 @@ class IntelligentCommandSender:
               "binary", "hex_prefixed", "hex_escaped", "decimal", "decimal_csv", "hex", or "ascii",
               and normalized_string is the input string with extraneous formatting removed.
         """
-        input_string = input_string.strip()
-        # Check for binary format: only 0's, 1's, and spaces
-        if all(c in '01 ' for c in input_string):
-            return "binary", input_string.replace(" ", "")
-        # Check for hex with "0x" prefix
-        if input_string.lower().startswith('0x') or ' 0x' in input_string.lower():
-            return "hex_prefixed", input_string.lower().replace("0x", "").replace(" ", "")
-        # Check for escaped hex (e.g., "\x41\x42")
-        if '\\x' in input_string:
-            return "hex_escaped", input_string.replace("\\x", "").replace(" ", "")
-        # Check for space-separated decimals
-        if all(part.isdigit() for part in input_string.split()):
-            return "decimal", input_string
-        # Check for comma-separated decimals
-        if ',' in input_string and all(part.strip().isdigit() for part in input_string.split(',')):
-            return "decimal_csv", input_string
-        # Check for a valid hex string without prefix
-        if all(c in '0123456789ABCDEFabcdef ' for c in input_string):
-            return "hex", input_string.replace(" ", "")
-        # Otherwise, treat as ASCII
-        return "ascii", input_string
+        return _detect_format(input_string)
 
     @staticmethod
     def convert_to_bytes(format_type: str, input_string: str) -> bytes:
@@ -74,29 +151,7 @@ class IntelligentCommandSender:
         Raises:
             ValueError: If the conversion fails or the format is unsupported.
         """
-        try:
-            if format_type == "binary":
-                # Ensure the binary string length is a multiple of 8
-                while len(input_string) % 8 != 0:
-                    input_string += '0'
-                return bytes(
-                    int(input_string[i:i+8], 2)
-                    for i in range(0, len(input_string), 8)
-                )
-            elif format_type in ["hex", "hex_prefixed", "hex_escaped"]:
-                return bytes.fromhex(input_string)
-            elif format_type in ["decimal", "decimal_csv"]:
-                if ',' in input_string:
-                    numbers = [int(x.strip()) for x in input_string.split(',')]
-                else:
-                    numbers = [int(x) for x in input_string.split()]
-                return bytes(numbers)
-            elif format_type == "ascii":
-                return input_string.encode('ascii')
-            else:
-                raise ValueError(f"Unsupported format: {format_type}")
-        except Exception as e:
-            raise ValueError(f"Conversion error: {str(e)}")
+        return _convert_to_bytes(format_type, input_string)
 
     @staticmethod
     def format_output_suggestion(raw_response: bytes) -> str:
@@ -109,17 +164,13 @@ class IntelligentCommandSender:
         Returns:
             A string indicating the suggested output format (e.g., "ASCII" or "Hex").
         """
-        if not raw_response:
-            return "Hex"
-        try:
-            decoded = raw_response.decode('ascii')
-            if all(32 <= ord(c) <= 126 or c in '\r\n' for c in decoded):
-                return "ASCII"
-        except Exception:
-            pass
-        if any(b > 127 for b in raw_response):
+        # Any byte above 0x7F rules out both ASCII and Decimal; isascii() checks that
+        # in one C pass without allocating.
+        if not raw_response or not raw_response.isascii():
             return "Hex"
-        if all(b < 100 for b in raw_response):
+        if not raw_response.translate(None, _PRINTABLE):
+            return "ASCII"
+        if max(raw_response) < 100:
             return "Decimal"
         return "Hex"
 
@@ -153,24 +204,34 @@ class IntelligentCommandSender:
                 "response_raw": None,
                 "rs_mode": communicator.rs_mode
             }
-            if communicator.ser and communicator.ser.is_open:
-                communicator.ser.reset_input_buffer()
-                communicator.ser.reset_output_buffer()
-                if communicator.rs_mode == "RS485":
-                    if hasattr(communicator.ser, 'rs485_mode'):
-                        communicator.ser.rs485_mode = communicator.rs485_config
-                    communicator.ser.setRTS(communicator.rts_level_for_tx)
-                    time.sleep(communicator.rts_delay_before_tx)
-                communicator.ser.write(command_bytes)
-                communicator.ser.flush()
-                if communicator.rs_mode == "RS485":
-                    communicator.ser.setRTS(communicator.rts_level_for_rx)
-                    time.sleep(communicator.rts_delay_before_rx)
-                time.sleep(communicator.rts_delay)
+            ser = communicator.ser
+            if ser and ser.is_open:
+                # A fully read reply leaves nothing behind, so the flush is skipped only
+                # when the previous exchange ended cleanly and no late or unsolicited
+                # bytes have arrived since.
+                if not (getattr(communicator, 'buffers_clean', False) and ser.in_waiting == 0):
+                    _flush_buffers(ser)
+                communicator.buffers_clean = False
+                # In native RS485 mode the driver switches RTS around the write itself.
+                rs485 = communicator.rs_mode == "RS485" and not getattr(communicator, '_rs485_native', False)
+                settle = communicator.rts_delay
+                if rs485:
+                    ser.rts = communicator.rts_level_for_tx
+                    delay_before_tx = communicator.rts_delay_before_tx
+                    if delay_before_tx > 0:
+                        time.sleep(delay_before_tx)
+                ser.write(command_bytes)
+                ser.flush()
+                if rs485:
+                    ser.rts = communicator.rts_level_for_rx
+                    settle += communicator.rts_delay_before_rx
+                # The RX turnaround and inter-command delays are slept in one call.
+                if settle > 0:
+                    time.sleep(settle)
                 response = communicator.read_response()
                 if response:
-                    suggested_format = force_format or communicator.output_format
-                    communicator.set_output_format(suggested_format)
+                    communicator.buffers_clean = not getattr(communicator, 'continuous_output', False)
+                    communicator.set_output_format(force_format or communicator.output_format)
                     result.update({
                         "success": True,
                         "response_raw": response.hex(),
@@ -6,16 +6,60 @@ class based on the given gauge type. This abstraction decouples device-specific
 logic from the rest of the code.
 """
 
-# Import protocol classes from the gauges package.
-from serial_communication.gauges.protocols.cdg_protocol import CDGProtocol
-from serial_communication.gauges.protocols.magmpg_protocol import MAGMPGProtocol
-from serial_communication.gauges.protocols.pcg_protocol import PCGProtocol
-from serial_communication.gauges.protocols.ppg_protocol import PPGProtocol
-from serial_communication.gauges.protocols.bcg450_protocol import BCG450Protocol
-from serial_communication.gauges.protocols.bcg552_protocol import BCG552Protocol
-from serial_communication.gauges.protocols.bpg40x_protocol import BPG40xProtocol
-from serial_communication.gauges.protocols.bpg552_protocol import BPG552Protocol
-from serial_communication.turbos.protocols.tc600_protocol import TC600Protocol
+import importlib
+from functools import lru_cache
+
+_GAUGE_PROTOCOLS = "serial_communication.gauges.protocols"
+_TURBO_PROTOCOLS = "serial_communication.turbos.protocols"
+
+
+def _no_kwargs(params: dict, gauge_type: str) -> dict:
+    return {}
+
+
+def _ppg_kwargs(params: dict, gauge_type: str) -> dict:
+    return {"address": params.get("address", 254), "gauge_type": gauge_type}
+
+
+def _device_id_kwargs(default: int):
+    """Returns a kwargs builder passing the configured device ID, or the given default."""
+    def build(params: dict, gauge_type: str) -> dict:
+        return {"device_id": params.get("device_id", default)}
+    return build
+
+
+# Maps gauge type -> (protocol module, protocol class name, constructor kwargs builder).
+# Protocol modules are imported on first use so only the drivers actually needed get loaded.
+_PROTOCOLS = {
+    "PPG550": (f"{_GAUGE_PROTOCOLS}.ppg_protocol", "PPGProtocol", _ppg_kwargs),
+    "PPG570": (f"{_GAUGE_PROTOCOLS}.ppg_protocol", "PPGProtocol", _ppg_kwargs),
+    "PCG550": (f"{_GAUGE_PROTOCOLS}.pcg_protocol", "PCGProtocol", _device_id_kwargs(0x02)),
+    "PSG550": (f"{_GAUGE_PROTOCOLS}.pcg_protocol", "PCGProtocol", _device_id_kwargs(0x02)),
+    "MAG500": (f"{_GAUGE_PROTOCOLS}.magmpg_protocol", "MAGMPGProtocol", _device_id_kwargs(0x14)),
+    "MPG500": (f"{_GAUGE_PROTOCOLS}.magmpg_protocol", "MAGMPGProtocol", _device_id_kwargs(0x04)),
+    "CDG045D": (f"{_GAUGE_PROTOCOLS}.cdg_protocol", "CDGProtocol", _no_kwargs),
+    "CDG025D": (f"{_GAUGE_PROTOCOLS}.cdg_protocol", "CDGProtocol", _no_kwargs),
+    "BPG40x": (f"{_GAUGE_PROTOCOLS}.bpg40x_protocol", "BPG40xProtocol", _no_kwargs),
+    "BPG552": (f"{_GAUGE_PROTOCOLS}.bpg552_protocol", "BPG552Protocol", _no_kwargs),
+    "BCG450": (f"{_GAUGE_PROTOCOLS}.bcg450_protocol", "BCG450Protocol", _no_kwargs),
+    "BCG552": (f"{_GAUGE_PROTOCOLS}.bcg552_protocol", "BCG552Protocol", _no_kwargs),
+    "TC600": (f"{_TURBO_PROTOCOLS}.tc600_protocol", "TC600Protocol", _no_kwargs),
+}
+
+
+@lru_cache(maxsize=None)
+def _load(module_name: str, class_name: str):
+    """
+    Imports a protocol module on first use and returns the requested class.
+
+    Args:
+        module_name: Fully qualified module name.
+        class_name: Name of the protocol class inside that module.
+
+    Returns:
+        The protocol class.
+    """
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def get_protocol(gauge_type: str, params: dict):
@@ -32,25 +76,8 @@ def get_protocol(gauge_type: str, params: dict):
     Raises:
         ValueError: If the gauge type is unsupported.
     """
-    if gauge_type in ["PPG550", "PPG570"]:
-        return PPGProtocol(address=params.get("address", 254), gauge_type=gauge_type)
-    elif gauge_type in ["PCG550", "PSG550"]:
-        return PCGProtocol(device_id=params.get("device_id", 0x02))
-    elif gauge_type == "MAG500":
-        return MAGMPGProtocol(device_id=params.get("device_id", 0x14))
-    elif gauge_type == "MPG500":
-        return MAGMPGProtocol(device_id=params.get("device_id", 0x04))
-    elif gauge_type in ["CDG045D", "CDG025D"]:
-        return CDGProtocol()
-    elif gauge_type == "BPG40x":
-        return BPG40xProtocol()
-    elif gauge_type == "BPG552":
-        return BPG552Protocol()
-    elif gauge_type == "BCG450":
-        return BCG450Protocol()
-    elif gauge_type == "BCG552":
-        return BCG552Protocol()
-    elif gauge_type == "TC600":
-        return TC600Protocol()
-    else:
-        raise ValueError(f"Unsupported gauge type: {gauge_type}")
+    try:
+        module_name, class_name, build_kwargs = _PROTOCOLS[gauge_type]
+    except KeyError:
+        raise ValueError(f"Unsupported gauge type: {gauge_type}") from None
+    return _load(module_name, class_name)(**build_kwargs(params, gauge_type))
@@ -5,14 +5,65 @@ Defines the ResponseHandler class for converting raw gauge response bytes
 into human-readable strings according to various output formats.
 """
 
+import struct
+from types import MappingProxyType
+
 from ..models import GaugeResponse
 
+# Per-byte text for the Binary and Decimal output formats, built once.
+_BIN_TABLE = tuple(format(i, '08b') for i in range(256))
+_DEC_TABLE = tuple(str(i) for i in range(256))
+# 9-byte CDG frame: start, page, status, error, pressure (int16 BE), read value, sensor type, checksum.
+_CDG_FRAME = struct.Struct('>BBBBhBBB')
+# Decoded CDG status byte for every possible value; read-only, callers get a copy.
+_CDG_STATUS = tuple(
+    MappingProxyType({
+        "unit": (status >> 4) & 0x03,
+        "heating": bool(status & 0x80),
+        "temp_ok": bool(status & 0x40),
+        "emission": bool(status & 0x20),
+    })
+    for status in range(256)
+)
+# Printable ASCII plus CR/LF; deleting these from a response leaves only non-text bytes.
+_PRINTABLE = bytes(range(32, 127)) + b'\r\n'
+# Bytes that str.strip() removes from ASCII text (bytes.strip() alone misses 0x1c-0x1f).
+_ASCII_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+
+def _format_binary(response: bytes) -> str:
+    return ' '.join([_BIN_TABLE[byte] for byte in response])
+
+
+def _format_decimal(response: bytes) -> str:
+    return ' '.join([_DEC_TABLE[byte] for byte in response])
+
+
+# Output format -> formatter; unknown formats fall back to str(response).
+_FORMATTERS = {
+    "Hex": lambda response: response.hex(' '),
+    "Binary": _format_binary,
+    "ASCII": lambda response: response.decode('ascii', errors='replace'),
+    "UTF-8": lambda response: response.decode('utf-8', errors='replace'),
+    "Decimal": _format_decimal,
+}
+
+
+def _format_with(formatter, response: bytes) -> str:
+    # None of the formatters can fail on bytes: decoding uses errors='replace'
+    # and the Binary/Decimal tables cover every byte value.
+    if not response:
+        return "No response"
+    return formatter(response)
+
 
 class ResponseHandler:
     """
     Formats and processes raw responses from gauges.
     """
 
+    __slots__ = ("_output_format", "_formatter")
+
     def __init__(self, output_format: str = "ASCII"):
         """
         Initializes the ResponseHandler.
@@ -22,6 +73,16 @@ class ResponseHandler:
         """
         self.output_format = output_format
 
+    @property
+    def output_format(self) -> str:
+        return self._output_format
+
+    @output_format.setter
+    def output_format(self, format_type: str) -> None:
+        # The formatter is resolved here so format_response does no format dispatch.
+        self._output_format = format_type
+        self._formatter = _FORMATTERS.get(format_type, str)
+
     def format_response(self, response: bytes) -> str:
         """
         Converts raw bytes to a formatted string according to the output format.
@@ -32,23 +93,7 @@ class ResponseHandler:
         Returns:
             A formatted string representation.
         """
-        if not response:
-            return "No response"
-        try:
-            if self.output_format == "Hex":
-                return ' '.join(f'{byte:02x}' for byte in response)
-            elif self.output_format == "Binary":
-                return ' '.join(f'{byte:08b}' for byte in response)
-            elif self.output_format == "ASCII":
-                return response.decode('ascii', errors='replace')
-            elif self.output_format == "UTF-8":
-                return response.decode('utf-8', errors='replace')
-            elif self.output_format == "Decimal":
-                return ' '.join(str(byte) for byte in response)
-            else:
-                return str(response)
-        except Exception as e:
-            return f"Error formatting response: {str(e)}"
+        return _format_with(self._formatter, response)
 
     def suggest_format(self, raw_response: bytes) -> str:
         """
@@ -60,17 +105,13 @@ class ResponseHandler:
         Returns:
             A string indicating the suggested format.
         """
-        if not raw_response:
-            return "Hex"
-        try:
-            decoded = raw_response.decode('ascii')
-            if all(32 <= ord(c) <= 126 or c in '\r\n' for c in decoded):
-                return "ASCII"
-        except:
-            pass
-        if any(b > 127 for b in raw_response):
+        # Any byte above 0x7F rules out both ASCII and Decimal; isascii() checks that
+        # in one C pass without allocating.
+        if not raw_response or not raw_response.isascii():
             return "Hex"
-        if all(b < 100 for b in raw_response):
+        if not raw_response.translate(None, _PRINTABLE):
+            return "ASCII"
+        if max(raw_response) < 100:
             return "Decimal"
         return "Hex"
 
@@ -83,12 +124,14 @@ class ResponseHandler:
         """
         self.output_format = format_type
 
-    def process_cdg_frame(self, response: bytes) -> dict:
+    @staticmethod
+    def process_cdg_frame(response: bytes) -> dict:
         """
         Processes a 9-byte CDG frame and returns a dictionary with parsed values.
 
         Args:
-            response: The 9-byte frame from a CDG gauge.
+            response: The 9-byte frame from a CDG gauge. A memoryview slice of a
+                larger read buffer may be passed to avoid copying the frame out.
 
         Returns:
             A dictionary with parsed data or an error message.
@@ -96,57 +139,29 @@ class ResponseHandler:
         if len(response) != 9:
             return {"error": "Invalid frame length"}
         try:
+            response = memoryview(response)
+            start_byte, page_no, status, error, pressure_raw, read_value, sensor_type, checksum = \
+                _CDG_FRAME.unpack(response)
+            # Checksum is the low byte of the sum of bytes 1-7, taken from the unpacked fields.
+            checksum_calc = (page_no + status + error + (pressure_raw >> 8) + pressure_raw
+                             + read_value + sensor_type) & 0xFF
             return {
-                "start_byte": response[0],
-                "page_no": response[1],
-                "status": {
-                    "unit": (response[2] >> 4) & 0x03,
-                    "heating": bool(response[2] & 0x80),
-                    "temp_ok": bool(response[2] & 0x40),
-                    "emission": bool(response[2] & 0x20),
-                },
-                "error": response[3],
-                "pressure": self._calculate_cdg_pressure(response[4], response[5]),
-                "read_value": response[6],
-                "sensor_type": response[7],
-                "checksum": response[8],
-                "checksum_valid": self._verify_cdg_checksum(response),
+                "start_byte": start_byte,
+                "page_no": page_no,
+                "status": dict(_CDG_STATUS[status]),
+                "error": error,
+                # Pressure is a signed 16-bit fixed-point value with 14 fractional bits
+                "pressure": pressure_raw / 16384.0,
+                "read_value": read_value,
+                "sensor_type": sensor_type,
+                "checksum": checksum,
+                "checksum_valid": checksum == checksum_calc,
             }
         except Exception as e:
             return {"error": f"Frame processing error: {str(e)}"}
 
-    def _calculate_cdg_pressure(self, high_byte: int, low_byte: int) -> float:
-        """
-        Calculates pressure from two bytes using fixed-point arithmetic.
-
-        Args:
-            high_byte: The high byte.
-            low_byte: The low byte.
-
-        Returns:
-            The calculated pressure as a float.
-        """
-        pressure_value = (high_byte << 8) | low_byte
-        if pressure_value & 0x8000:
-            pressure_value = -((~pressure_value + 1) & 0xFFFF)
-        return pressure_value / 16384.0
-
-    def _verify_cdg_checksum(self, frame: bytes) -> bool:
-        """
-        Verifies the checksum of a 9-byte CDG frame.
-
-        Args:
-            frame: The 9-byte frame.
-
-        Returns:
-            True if the checksum is valid, False otherwise.
-        """
-        if len(frame) != 9:
-            return False
-        calc_checksum = sum(frame[1:8]) & 0xFF
-        return calc_checksum == frame[8]
-
-    def parse_ppg_response(self, response: bytes) -> dict:
+    @staticmethod
+    def parse_ppg_response(response: bytes) -> dict:
         """
         Parses an ASCII response from a PPG gauge.
 
@@ -157,15 +172,16 @@ class ResponseHandler:
             A dictionary with the parsed data or an error.
         """
         try:
-            decoded = response.decode('ascii', errors='replace').strip()
-            if not decoded.startswith('@') or not decoded.endswith(';FF'):
+            # Framing is checked on the bytes; only the payload gets decoded.
+            frame = response.strip(_ASCII_WHITESPACE)
+            if not frame.startswith(b'@') or not frame.endswith(b';FF'):
                 return {"error": "Invalid response format"}
-            if decoded.startswith('@ACK'):
-                data = decoded[4:-3]
-            elif decoded.startswith('@NAK'):
-                return {"error": f"Command failed: {decoded[4:-3]}"}
+            if frame.startswith(b'@ACK'):
+                data = frame[4:-3].decode('ascii', errors='replace')
+            elif frame.startswith(b'@NAK'):
+                return {"error": f"Command failed: {frame[4:-3].decode('ascii', errors='replace')}"}
             else:
-                data = decoded[1:-3]
+                data = frame[1:-3].decode('ascii', errors='replace')
             return {
                 "data": data,
                 "values": data.split(',') if ',' in data else [data]
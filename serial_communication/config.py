@@ -6,10 +6,16 @@ command definitions, output formats, and logging setup.
 """
 
 import logging
-from typing import Dict, Any
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 import serial
 
+# Supported RS modes, shared by every gauge entry that lists them.
+_RS_BOTH = frozenset({"RS232", "RS485"})
+_RS232_ONLY = frozenset({"RS232"})
+
 # Default output formats per gauge.
 GAUGE_OUTPUT_FORMATS = {
     "CDGxxxD": "Hex",
@@ -31,6 +37,40 @@ GAUGE_OUTPUT_FORMATS = {
     "TC600": "ASCII"
 }
 
+# Read commands shared by the Pfeiffer binary-protocol gauges (PCG550, PSG550, MAG500, MPG500).
+# "pressure" is defined per gauge because its data type differs.
+_COMMON_BINARY_COMMANDS = {
+    "temperature": {"pid": 222, "cmd": 1, "desc": "Read temperature"},
+    "serial_number": {"pid": 207, "cmd": 1, "desc": "Read serial number"},
+    "product_name": {"pid": 208, "cmd": 1, "desc": "Read product name"},
+    "software_version": {"pid": 218, "cmd": 1, "desc": "Read software version"},
+    "device_exception": {"pid": 228, "cmd": 1, "desc": "Read device errors"},
+    "run_hours": {"pid": 104, "cmd": 1, "desc": "Read operating hours"}
+}
+
+# Commands shared by all CDG gauges, and the extended set supported by CDGxxxD/CDG045D.
+_COMMON_CDG_COMMANDS = {
+    "pressure": {"cmd": "read", "name": "pressure", "desc": "Read pressure"},
+    "temperature": {"cmd": "read", "name": "temperature", "desc": "Read temperature status"},
+    "software_version": {"cmd": "read", "name": "software_version", "desc": "Read software version"},
+    "filter_mode": {"cmd": "read", "name": "filter", "desc": "Read filter mode (0=dynamic, 1=fast, 2=slow)"},
+    "output_units": {"cmd": "read", "name": "unit", "desc": "Read pressure units (0=mbar, 1=Torr, 2=Pa)"},
+    "zero_adjust": {"cmd": "special", "name": "zero_adjust", "desc": "Perform zero adjustment"},
+    "reset": {"cmd": "special", "name": "reset", "desc": "Reset gauge"},
+    "factory_reset": {"cmd": "special", "name": "reset_factory", "desc": "Reset to factory defaults"},
+    "gauge_type": {"cmd": "read", "name": "cdg_type", "desc": "Read gauge type"},
+    "production_number": {"cmd": "read", "name": "production_no", "desc": "Read production number"},
+    "calibration_date": {"cmd": "read", "name": "calib_date", "desc": "Read calibration date"},
+    "remaining_zero": {"cmd": "read", "name": "remaining_zero", "desc": "Read max remaining zero adjust value"},
+    "extended_error": {"cmd": "read", "name": "extended_error", "desc": "Read extended error status"}
+}
+_CDG_EXTENDED_COMMANDS = {
+    "heating_status": {"cmd": "read", "name": "heating_status", "desc": "Read heating status"},
+    "temperature_ok": {"cmd": "read", "name": "temperature_ok", "desc": "Check if temperature is OK"},
+    "zero_adjust_value": {"cmd": "read", "name": "zero_adjust_value", "desc": "Read zero adjustment value"},
+    "dc_output_offset": {"cmd": "read", "name": "dc_output_offset", "desc": "Read DC output offset"}
+}
+
 # Gauge-specific parameters and command definitions.
 GAUGE_PARAMETERS = {
     "PCG550": {
@@ -38,12 +78,7 @@ GAUGE_PARAMETERS = {
         "device_id": 0x02,
         "commands": {
             "pressure": {"pid": 221, "cmd": 1, "desc": "Read pressure (Fixs32en20)"},
-            "temperature": {"pid": 222, "cmd": 1, "desc": "Read temperature"},
-            "serial_number": {"pid": 207, "cmd": 1, "desc": "Read serial number"},
-            "product_name": {"pid": 208, "cmd": 1, "desc": "Read product name"},
-            "software_version": {"pid": 218, "cmd": 1, "desc": "Read software version"},
-            "device_exception": {"pid": 228, "cmd": 1, "desc": "Read device errors"},
-            "run_hours": {"pid": 104, "cmd": 1, "desc": "Read operating hours"}
+            **_COMMON_BINARY_COMMANDS
         }
     },
     "PSG550": {
@@ -51,12 +86,7 @@ GAUGE_PARAMETERS = {
         "device_id": 0x02,
         "commands": {
             "pressure": {"pid": 221, "cmd": 1, "desc": "Read pressure (Fixs32en20)"},
-            "temperature": {"pid": 222, "cmd": 1, "desc": "Read temperature"},
-            "serial_number": {"pid": 207, "cmd": 1, "desc": "Read serial number"},
-            "product_name": {"pid": 208, "cmd": 1, "desc": "Read product name"},
-            "software_version": {"pid": 218, "cmd": 1, "desc": "Read software version"},
-            "device_exception": {"pid": 228, "cmd": 1, "desc": "Read device errors"},
-            "run_hours": {"pid": 104, "cmd": 1, "desc": "Read operating hours"},
+            **_COMMON_BINARY_COMMANDS,
             "pirani_full_scale": {"pid": 33000, "cmd": 1, "desc": "Read Pirani full scale"},
             "pirani_adjust": {"pid": 417, "cmd": 3, "desc": "Execute Pirani adjustment"}
         }
@@ -64,7 +94,7 @@ GAUGE_PARAMETERS = {
     "PPG550": {
         "baudrate": 9600,
         "protocol": "ascii",
-        "rs_modes": ["RS232", "RS485"],
+        "rs_modes": _RS_BOTH,
         "commands": {
             "pressure": {"cmd": "PR3", "type": "read", "desc": "Read pressure measurement"},
             "temperature": {"cmd": "T", "type": "read", "desc": "Read temperature"},
@@ -79,7 +109,7 @@ GAUGE_PARAMETERS = {
     "PPG570": {
         "baudrate": 9600,
         "protocol": "ascii",
-        "rs_modes": ["RS232", "RS485"],
+        "rs_modes": _RS_BOTH,
         "commands": {
             "pressure": {"cmd": "PR3", "type": "read", "desc": "Read pressure measurement"},
             "temperature": {"cmd": "T", "type": "read", "desc": "Read temperature"},
@@ -100,12 +130,7 @@ GAUGE_PARAMETERS = {
         "device_id": 0x14,
         "commands": {
             "pressure": {"pid": 221, "cmd": 1, "desc": "Read pressure (LogFixs32en26)"},
-            "temperature": {"pid": 222, "cmd": 1, "desc": "Read temperature"},
-            "serial_number": {"pid": 207, "cmd": 1, "desc": "Read serial number"},
-            "product_name": {"pid": 208, "cmd": 1, "desc": "Read product name"},
-            "software_version": {"pid": 218, "cmd": 1, "desc": "Read software version"},
-            "device_exception": {"pid": 228, "cmd": 1, "desc": "Read device errors"},
-            "run_hours": {"pid": 104, "cmd": 1, "desc": "Read operating hours"},
+            **_COMMON_BINARY_COMMANDS,
             "ccig_status": {"pid": 533, "cmd": 1, "desc": "CCIG Status (0=off, 1=on not ignited, 3=on and ignited)"},
             "ccig_control": {"pid": 529, "cmd": 3, "desc": "Switch CCIG on/off"},
             "ccig_full_scale": {"pid": 503, "cmd": 1, "desc": "Read CCIG full scale"},
@@ -117,12 +142,7 @@ GAUGE_PARAMETERS = {
         "device_id": 0x04,
         "commands": {
             "pressure": {"pid": 221, "cmd": 1, "desc": "Read pressure (LogFixs32en26)"},
-            "temperature": {"pid": 222, "cmd": 1, "desc": "Read temperature"},
-            "serial_number": {"pid": 207, "cmd": 1, "desc": "Read serial number"},
-            "product_name": {"pid": 208, "cmd": 1, "desc": "Read product name"},
-            "software_version": {"pid": 218, "cmd": 1, "desc": "Read software version"},
-            "device_exception": {"pid": 228, "cmd": 1, "desc": "Read device errors"},
-            "run_hours": {"pid": 104, "cmd": 1, "desc": "Read operating hours"},
+            **_COMMON_BINARY_COMMANDS,
             "active_sensor": {"pid": 223, "cmd": 1, "desc": "Current active sensor (1=CCIG, 2=Pirani, 3=Mixed)"},
             "pirani_full_scale": {"pid": 33000, "cmd": 1, "desc": "Read Pirani full scale"},
             "pirani_adjust": {"pid": 417, "cmd": 3, "desc": "Execute Pirani adjustment"}
@@ -141,7 +161,7 @@ GAUGE_PARAMETERS = {
             "pirani_adjust": {"pid": 417, "cmd": 3, "desc": "Execute Pirani adjustment"},
             "ba_degas": {"pid": 529, "cmd": 3, "desc": "Control BA degas"}
         },
-        "rs_modes": ["RS232", "RS485"],
+        "rs_modes": _RS_BOTH,
         "timeout": 1.0,
         "write_timeout": 1.0
     },
@@ -151,26 +171,8 @@ GAUGE_PARAMETERS = {
         "parity": serial.PARITY_NONE,
         "stopbits": serial.STOPBITS_ONE,
         "device_id": 0x00,
-        "commands": {
-            "pressure": {"cmd": "read", "name": "pressure", "desc": "Read pressure"},
-            "temperature": {"cmd": "read", "name": "temperature", "desc": "Read temperature status"},
-            "software_version": {"cmd": "read", "name": "software_version", "desc": "Read software version"},
-            "filter_mode": {"cmd": "read", "name": "filter", "desc": "Read filter mode (0=dynamic, 1=fast, 2=slow)"},
-            "output_units": {"cmd": "read", "name": "unit", "desc": "Read pressure units (0=mbar, 1=Torr, 2=Pa)"},
-            "zero_adjust": {"cmd": "special", "name": "zero_adjust", "desc": "Perform zero adjustment"},
-            "reset": {"cmd": "special", "name": "reset", "desc": "Reset gauge"},
-            "factory_reset": {"cmd": "special", "name": "reset_factory", "desc": "Reset to factory defaults"},
-            "gauge_type": {"cmd": "read", "name": "cdg_type", "desc": "Read gauge type"},
-            "production_number": {"cmd": "read", "name": "production_no", "desc": "Read production number"},
-            "calibration_date": {"cmd": "read", "name": "calib_date", "desc": "Read calibration date"},
-            "remaining_zero": {"cmd": "read", "name": "remaining_zero", "desc": "Read max remaining zero adjust value"},
-            "extended_error": {"cmd": "read", "name": "extended_error", "desc": "Read extended error status"},
-            "heating_status": {"cmd": "read", "name": "heating_status", "desc": "Read heating status"},
-            "temperature_ok": {"cmd": "read", "name": "temperature_ok", "desc": "Check if temperature is OK"},
-            "zero_adjust_value": {"cmd": "read", "name": "zero_adjust_value", "desc": "Read zero adjustment value"},
-            "dc_output_offset": {"cmd": "read", "name": "dc_output_offset", "desc": "Read DC output offset"}
-        },
-        "rs_modes": ["RS232"],
+        "commands": {**_COMMON_CDG_COMMANDS, **_CDG_EXTENDED_COMMANDS},
+        "rs_modes": _RS232_ONLY,
         "timeout": 1,
         "write_timeout": 1
     },
@@ -180,22 +182,8 @@ GAUGE_PARAMETERS = {
         "parity": serial.PARITY_NONE,
         "stopbits": serial.STOPBITS_ONE,
         "device_id": 0x00,
-        "commands": {
-            "pressure": {"cmd": "read", "name": "pressure", "desc": "Read pressure"},
-            "temperature": {"cmd": "read", "name": "temperature", "desc": "Read temperature status"},
-            "software_version": {"cmd": "read", "name": "software_version", "desc": "Read software version"},
-            "filter_mode": {"cmd": "read", "name": "filter", "desc": "Read filter mode (0=dynamic, 1=fast, 2=slow)"},
-            "output_units": {"cmd": "read", "name": "unit", "desc": "Read pressure units (0=mbar, 1=Torr, 2=Pa)"},
-            "zero_adjust": {"cmd": "special", "name": "zero_adjust", "desc": "Perform zero adjustment"},
-            "reset": {"cmd": "special", "name": "reset", "desc": "Reset gauge"},
-            "factory_reset": {"cmd": "special", "name": "reset_factory", "desc": "Reset to factory defaults"},
-            "gauge_type": {"cmd": "read", "name": "cdg_type", "desc": "Read gauge type"},
-            "production_number": {"cmd": "read", "name": "production_no", "desc": "Read production number"},
-            "calibration_date": {"cmd": "read", "name": "calib_date", "desc": "Read calibration date"},
-            "remaining_zero": {"cmd": "read", "name": "remaining_zero", "desc": "Read max remaining zero adjust value"},
-            "extended_error": {"cmd": "read", "name": "extended_error", "desc": "Read extended error status"}
-        },
-        "rs_modes": ["RS232"],
+        "commands": dict(_COMMON_CDG_COMMANDS),
+        "rs_modes": _RS232_ONLY,
         "timeout": 1,
         "write_timeout": 1
     },
@@ -206,26 +194,11 @@ GAUGE_PARAMETERS = {
         "stopbits": serial.STOPBITS_ONE,
         "device_id": 0x00,
         "commands": {
-            "pressure": {"cmd": "read", "name": "pressure", "desc": "Read pressure"},
-            "temperature": {"cmd": "read", "name": "temperature", "desc": "Read temperature status"},
-            "software_version": {"cmd": "read", "name": "software_version", "desc": "Read software version"},
-            "filter_mode": {"cmd": "read", "name": "filter", "desc": "Read filter mode (0=dynamic, 1=fast, 2=slow)"},
-            "output_units": {"cmd": "read", "name": "unit", "desc": "Read pressure units (0=mbar, 1=Torr, 2=Pa)"},
-            "zero_adjust": {"cmd": "special", "name": "zero_adjust", "desc": "Perform zero adjustment"},
-            "reset": {"cmd": "special", "name": "reset", "desc": "Reset gauge"},
-            "factory_reset": {"cmd": "special", "name": "reset_factory", "desc": "Reset to factory defaults"},
-            "gauge_type": {"cmd": "read", "name": "cdg_type", "desc": "Read gauge type"},
-            "production_number": {"cmd": "read", "name": "production_no", "desc": "Read production number"},
-            "calibration_date": {"cmd": "read", "name": "calib_date", "desc": "Read calibration date"},
-            "remaining_zero": {"cmd": "read", "name": "remaining_zero", "desc": "Read max remaining zero adjust value"},
-            "extended_error": {"cmd": "read", "name": "extended_error", "desc": "Read extended error status"},
-            "heating_status": {"cmd": "read", "name": "heating_status", "desc": "Read heating status"},
-            "temperature_ok": {"cmd": "read", "name": "temperature_ok", "desc": "Check if temperature is OK"},
-            "zero_adjust_value": {"cmd": "read", "name": "zero_adjust_value", "desc": "Read zero adjustment value"},
-            "dc_output_offset": {"cmd": "read", "name": "dc_output_offset", "desc": "Read DC output offset"},
+            **_COMMON_CDG_COMMANDS,
+            **_CDG_EXTENDED_COMMANDS,
             "data_tx_mode": {"cmd": "special", "name": "data_tx_mode", "desc": "Toggle data transmission mode"}
         },
-        "rs_modes": ["RS232"],
+        "rs_modes": _RS232_ONLY,
         "timeout": 1,
         "write_timeout": 1
     },
@@ -235,7 +208,7 @@ GAUGE_PARAMETERS = {
         "parity": serial.PARITY_NONE,
         "stopbits": serial.STOPBITS_ONE,
         "device_id": 0x02,
-        "rs_modes": ["RS232", "RS485"],
+        "rs_modes": _RS_BOTH,
         "commands": {
             "motor_on": {"pid": 23, "cmd": 3, "desc": "Start/stop pump motor"},
             "get_speed": {"pid": 309, "cmd": 1, "desc": "Read actual rotation speed (rpm)"},
@@ -257,15 +230,69 @@ GAUGE_PARAMETERS = {
     }
 }
 
-# Global list of available output formats.
-OUTPUT_FORMATS = ["Hex", "Binary", "ASCII", "UTF-8", "Decimal", "Raw Bytes"]
-# Global list of common baud rates.
-BAUD_RATES = [9600, 19200, 38400, 57600, 115200]
+
+def _freeze(value: Any, memo: Dict[int, Any] = None) -> Any:
+    """
+    Recursively wraps nested dicts in read-only MappingProxyType views and interns
+    string keys and values, so the tables can be shared safely between consumers.
+    A dict reachable from several places (e.g. the shared command descriptors) is
+    frozen once and the same view is reused everywhere.
+
+    Args:
+        value: A config value (dict, str or any other leaf).
+        memo: Frozen views already built, keyed by id() of the source dict.
+
+    Returns:
+        The frozen equivalent of the value.
+    """
+    if isinstance(value, dict):
+        if memo is None:
+            memo = {}
+        frozen = memo.get(id(value))
+        if frozen is None:
+            frozen = memo[id(value)] = MappingProxyType({
+                sys.intern(k) if isinstance(k, str) else k: _freeze(v, memo) for k, v in value.items()
+            })
+        return frozen
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+# Config tables are read-only; consumers that need to modify them must copy first.
+GAUGE_OUTPUT_FORMATS: Mapping[str, str] = _freeze(GAUGE_OUTPUT_FORMATS)
+GAUGE_PARAMETERS: Mapping[str, Mapping[str, Any]] = _freeze(GAUGE_PARAMETERS)
+
+# Ready-to-use serial.Serial keyword arguments per gauge, with defaults filled in.
+_SERIAL_DEFAULTS = {
+    "bytesize": serial.EIGHTBITS,
+    "parity": serial.PARITY_NONE,
+    "stopbits": serial.STOPBITS_ONE,
+    "timeout": 2,
+    "write_timeout": 2
+}
+_SERIAL_KEYS = ("baudrate", "bytesize", "parity", "stopbits", "timeout", "write_timeout")
+GAUGE_SERIAL_KWARGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    gauge: MappingProxyType({**_SERIAL_DEFAULTS, **{k: spec[k] for k in _SERIAL_KEYS if k in spec}})
+    for gauge, spec in GAUGE_PARAMETERS.items()
+})
+
+# Available output formats, in display order, plus a set for membership checks.
+OUTPUT_FORMATS = ("Hex", "Binary", "ASCII", "UTF-8", "Decimal", "Raw Bytes")
+OUTPUT_FORMATS_SET = frozenset(OUTPUT_FORMATS)
+# Common baud rates, in display order.
+BAUD_RATES = (9600, 19200, 38400, 57600, 115200)
+
+
+# One formatter shared by every logger configured through setup_logging.
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_CONFIGURED_LOGGERS = set()
 
 
 def setup_logging(name: str) -> logging.Logger:
     """
-    Configures logging for the application.
+    Configures logging for the application. Repeated calls for the same name
+    return the already configured logger without replacing its handler.
 
     Args:
         name: The name for the logger.
@@ -274,12 +301,14 @@ def setup_logging(name: str) -> logging.Logger:
         A configured Logger instance.
     """
     logger = logging.getLogger(name)
+    if name in _CONFIGURED_LOGGERS:
+        return logger
     logger.setLevel(logging.DEBUG)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_LOG_FORMATTER)
     if logger.hasHandlers():
         logger.handlers.clear()
     logger.addHandler(console_handler)
+    _CONFIGURED_LOGGERS.add(name)
     return logger
@@ -15,6 +15,10 @@ Features for Gauges:
     configurable ranges, noise, and delays.
   - Simulated set commands (e.g., "set_pressure", "set_temperature", "data_tx_mode") update
     internal state and return an acknowledgment.
+  - Connection latency can be simulated with "connect_delay" and "disconnect_delay"
+    (seconds, default 0).
+  - The response delay can be given jitter via "latency_jitter" (seconds) and
+    "latency_distribution" ("normal" or "uniform").
   - A dummy protocol object is attached (via DummyProtocol) so UI components can read
     .protocol._command_defs without error.
 
@@ -23,8 +27,8 @@ Features for Turbos:
   - When simulating a turbo, no physical port is required (a default dummy port is assumed).
 
 Interface:
-  Implements connect(), disconnect(), send_command(), read_continuous(), stop_continuous_reading(),
-  set_output_format(), and set_rs_mode()—matching the real communicator’s interface.
+  Implements connect(), disconnect(), send_command(), read_continuous(), set_continuous_reading(),
+  stop_continuous_reading(), set_output_format(), and set_rs_mode()—matching the real communicator’s interface.
 
 Usage Example:
     simulator = DeviceSimulator(device_type="gauge", config={
@@ -41,13 +45,102 @@ Usage Example:
 """
 
 import random
+import struct
+import threading
 import time
 import logging
-from typing import Callable, Dict, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Optional, Tuple
 
 from serial_communication.models import GaugeCommand, GaugeResponse
 from serial_communication.config import GAUGE_PARAMETERS
 
+# CDG continuous output frame: start byte 0x07, page 0x01, status, error, 2-byte
+# measurement, command code, sensor type and checksum. Only the measurement and the
+# checksum change between frames.
+_CDG_FRAME_TEMPLATE = b"\x07\x01\x00\x00\x00\x00\x00\x00\x00"
+# Checksum contribution of the fixed bytes 1-3 and 6-7.
+_CDG_FIXED_SUM = sum(_CDG_FRAME_TEMPLATE[1:4]) + sum(_CDG_FRAME_TEMPLATE[6:8])
+# Packs the signed big-endian measurement into bytes 4-5 of the frame buffer.
+_PACK_CDG_MEASUREMENT = struct.Struct(">h").pack_into
+
+# Command definitions per gauge type, resolved once at import for DummyProtocol.
+_COMMAND_DEFS = {gauge: params.get("commands", {}) for gauge, params in GAUGE_PARAMETERS.items()}
+_NO_COMMANDS = MappingProxyType({})
+
+# Uniform [0, 1) source for the simulated readings; scaled in place rather than going
+# through random.uniform's Python-level wrapper on every sample.
+_random = random.random
+
+
+# Simulated error reply, encoded once.
+_ERROR_TEXT = "ERR_DISCONNECTED"
+_ERROR_RAW = _ERROR_TEXT.encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _acknowledgement(name: str) -> Tuple[str, bytes]:
+    """
+    Builds the generic acknowledgement for a command without a dedicated handler.
+
+    Args:
+        name: The command name.
+
+    Returns:
+        A tuple of (response text, UTF-8 encoded response).
+    """
+    text = f"{name} executed successfully"
+    return text, text.encode("utf-8")
+
+
+def _uniform_latency(base: float, jitter: float) -> float:
+    return random.uniform(base - jitter, base + jitter)
+
+
+# Samplers for the simulated response delay, called as sampler(base_delay, jitter).
+_LATENCY_DISTRIBUTIONS = {
+    "normal": random.gauss,
+    "uniform": _uniform_latency
+}
+
+
+@dataclass
+class GaugeState:
+    """
+    Mutable state of a simulated gauge. Pressure must be changed through
+    set_pressure() so that pressure_i16, the pressure as a saturated signed
+    16-bit CDG measurement, stays in sync.
+    """
+    __slots__ = ("pressure", "temperature", "data_tx_mode", "pressure_i16")
+    pressure: float          # Last simulated or set pressure
+    temperature: float       # Last simulated or set temperature
+    data_tx_mode: str        # Last value written with data_tx_mode
+
+    def __post_init__(self):
+        self.set_pressure(self.pressure)
+
+    def set_pressure(self, value: float) -> None:
+        """
+        Updates the pressure and its 16-bit CDG measurement.
+
+        Args:
+            value: The new pressure.
+        """
+        self.pressure_i16 = max(-32768, min(32767, int(value)))
+        self.pressure = value
+
+
+@dataclass
+class TurboState:
+    """
+    Mutable state of a simulated turbo pump.
+    """
+    __slots__ = ("speed", "motor_on")
+    speed: int               # Current speed in RPM
+    motor_on: bool           # True if the motor is running
+
 
 class DummyProtocol:
     """
@@ -55,8 +148,10 @@ class DummyProtocol:
     It exposes the _command_defs attribute populated from GAUGE_PARAMETERS for a given gauge type.
     """
 
+    __slots__ = ("_command_defs",)
+
     def __init__(self, gauge_type: str = "PPG550"):
-        self._command_defs = GAUGE_PARAMETERS.get(gauge_type, {}).get("commands", {})
+        self._command_defs = _COMMAND_DEFS.get(gauge_type, _NO_COMMANDS)
 
 
 class DeviceSimulator:
@@ -77,6 +172,15 @@ class DeviceSimulator:
       set_output_format(), and set_rs_mode().
     """
 
+    __slots__ = (
+        "device_type", "rs_mode", "config", "state", "protocol", "connected", "logger", "output_format",
+        "_read_handlers", "_write_handlers", "_response_log", "_stop_event",
+        "_cdg_frame", "_cdg_measurement", "_cdg_payload",
+        "_connect_delay", "_disconnect_delay", "_response_delay", "_error_prob", "_noise_level",
+        "_latency_jitter", "_sample_latency",
+        "_pressure_lo", "_pressure_span", "_temp_lo", "_temp_span", "_speed_lo", "_speed_hi"
+    )
+
     def __init__(self, device_type: str = "gauge", config: Optional[Dict[str, Any]] = None,
                  logger: Optional[logging.Logger] = None):
         self.device_type = device_type.lower()
@@ -91,13 +195,24 @@ class DeviceSimulator:
                 "response_delay": 0.1,
                 "error_probability": 0.0
             }
-            self.state = {
-                "pressure": random.uniform(*self.config["pressure_range"]),
-                "temperature": random.uniform(*self.config["temp_range"]),
-                "data_tx_mode": "0"
-            }
+            self.state = GaugeState(
+                pressure=random.uniform(*self.config["pressure_range"]),
+                temperature=random.uniform(*self.config["temp_range"]),
+                data_tx_mode="0"
+            )
             gauge_type = self.config.get("gauge_type", "PPG550")
             self.protocol = DummyProtocol(gauge_type=gauge_type)
+            self._read_handlers = {
+                "pressure": self._sim_pressure,
+                "temperature": self._sim_temperature
+            }
+            self._write_handlers = {
+                "data_tx_mode": self._sim_data_tx_mode,
+                "set_pressure": self._sim_set_pressure,
+                "set_temperature": self._sim_set_temperature,
+                "calibrate": self._sim_calibrate
+            }
+            self._response_log = "Simulated response"
         elif self.device_type == "turbo":
             self.config = config or {
                 "speed_range": (1000, 5000),
@@ -106,34 +221,121 @@ class DeviceSimulator:
                 "response_delay": 0.1,
                 "error_probability": 0.0
             }
-            self.state = {
-                "speed": random.randint(*self.config["speed_range"]),
-                "motor_on": self.config.get("motor_on", False)
-            }
+            self.state = TurboState(
+                speed=random.randint(*self.config["speed_range"]),
+                motor_on=self.config.get("motor_on", False)
+            )
             self.protocol = None  # For turbos, no protocol definitions are needed.
+            self._read_handlers = {"get_speed": self._sim_get_speed}
+            self._write_handlers = {
+                "set_speed": self._sim_set_speed,
+                "motor_on": self._sim_motor_on
+            }
+            self._response_log = "Simulated turbo response"
         else:
             raise ValueError("Unsupported device type. Use 'gauge' or 'turbo'.")
+        self._cdg_frame: Optional[bytearray] = None
+        # Raw and formatted bytes of the last CDG frame and the measurement they encode;
+        # an unchanged measurement reuses them in a fresh response.
+        self._cdg_measurement: Optional[int] = None
+        self._cdg_payload: Optional[Tuple[bytes, str]] = None
+        self._stop_event = threading.Event()
+        self._apply_config(self.config)
         self.connected = False
         self.logger = logger or logging.getLogger("DeviceSimulator")
         self.logger.setLevel(logging.DEBUG)
         self.output_format = "ASCII"
 
+    def _apply_config(self, config: Dict[str, Any]) -> None:
+        """
+        Caches the simulation settings in instance attributes so send_command does
+        not look them up on every call. Every value is converted before any attribute
+        is assigned, so an invalid configuration leaves the simulator unchanged.
+
+        Args:
+            config: The complete simulation configuration.
+
+        Raises:
+            ValueError: If a setting is invalid.
+        """
+        distribution = config.get("latency_distribution", "normal")
+        try:
+            sample_latency = _LATENCY_DISTRIBUTIONS[distribution]
+        except KeyError:
+            raise ValueError(f"Unsupported latency distribution: {distribution}") from None
+        error_prob = float(config.get("error_probability", 0.0))
+        latency_jitter = float(config.get("latency_jitter", 0.0))
+        if self.device_type == "gauge":
+            pressure_lo, pressure_hi = config.get("pressure_range", (0.1, 1000))
+            temp_lo, temp_hi = config.get("temp_range", (-50, 300))
+            pressure_span = pressure_hi - pressure_lo
+            temp_span = temp_hi - temp_lo
+            is_cdg = config.get("gauge_type", "PPG550").startswith("CDG")
+        else:
+            speed_lo, speed_hi = config.get("speed_range", (1000, 5000))
+
+        self._connect_delay = config.get("connect_delay", 0.0)
+        self._disconnect_delay = config.get("disconnect_delay", 0.0)
+        self._response_delay = config.get("response_delay", 0.1)
+        self._error_prob = error_prob
+        self._noise_level = config.get("noise_level", 0.05)
+        self._latency_jitter = latency_jitter
+        self._sample_latency = sample_latency
+        if self.device_type == "gauge":
+            self._pressure_lo, self._pressure_span = pressure_lo, pressure_span
+            self._temp_lo, self._temp_span = temp_lo, temp_span
+            # Reusable frame buffer for CDG gauges; None for other gauge types.
+            if not is_cdg:
+                self._cdg_frame = None
+            elif self._cdg_frame is None:
+                self._cdg_frame = bytearray(_CDG_FRAME_TEMPLATE)
+        else:
+            self._speed_lo, self._speed_hi = speed_lo, speed_hi
+
+    def update_config(self, config: Dict[str, Any]) -> None:
+        """
+        Updates the simulation configuration and refreshes the cached settings.
+        The merged configuration is validated before it replaces the current one.
+
+        Args:
+            config: Simulation options to merge into the current configuration.
+
+        Raises:
+            ValueError: If a merged setting is invalid; the configuration is left unchanged.
+        """
+        merged = {**self.config, **config}
+        self._apply_config(merged)
+        self.config = merged
+
     def connect(self) -> bool:
         self.logger.debug("Simulated device connecting...")
         # For turbos, if no port is provided, ignore port selection.
-        time.sleep(0.1)
+        if self._connect_delay:
+            time.sleep(self._connect_delay)
+        # A stop left over from an earlier session must not end the next continuous read.
+        self._stop_event.clear()
         self.connected = True
         self.logger.info("Simulated device connected.")
         return True
 
     def disconnect(self) -> bool:
         self.logger.debug("Simulated device disconnecting...")
-        time.sleep(0.05)
+        if self._disconnect_delay:
+            time.sleep(self._disconnect_delay)
         self.connected = False
+        self._stop_event.set()
         self.logger.info("Simulated device disconnected.")
         return True
 
+    def set_continuous_reading(self, enabled: bool) -> None:
+        if enabled:
+            self._stop_event.clear()
+        else:
+            self._stop_event.set()
+        self.logger.debug(f"Simulated continuous reading {'enabled' if enabled else 'disabled'}")
+
     def stop_continuous_reading(self) -> None:
+        self._stop_event.set()
         self.logger.debug("Simulated stop continuous reading.")
 
     def set_output_format(self, fmt: str) -> None:
@@ -145,130 +347,168 @@ class DeviceSimulator:
         self.logger.debug(f"Simulator RS mode set to: {mode}")
 
     def send_command(self, command: GaugeCommand) -> GaugeResponse:
+        return self._respond(command, True)
+
+    def _respond(self, command: GaugeCommand, simulate_delay: bool) -> GaugeResponse:
+        """
+        Produces the simulated response to a command.
+
+        Args:
+            command: The command to answer.
+            simulate_delay: Whether to sleep for the configured response latency.
+                Continuous reading passes False because the delay is part of its
+                read schedule instead.
+
+        Returns:
+            The simulated GaugeResponse.
+        """
         if not self.connected:
             error_msg = "Simulated device not connected."
             self.logger.error(error_msg)
             return GaugeResponse(raw_data=b"", formatted_data="", success=False, error_message=error_msg)
 
-        time.sleep(self.config.get("response_delay", 0.1))
-        self.logger.debug(f"Simulated command received: {command.name}")
+        if simulate_delay:
+            delay = self._response_delay
+            if self._latency_jitter:
+                delay = self._sample_latency(delay, self._latency_jitter)
+            if delay > 0:
+                time.sleep(delay)
+        # Hot-path log calls pass their arguments lazily so nothing is interpolated
+        # unless the record is actually emitted.
+        self.logger.debug("Simulated command received: %s", command.name)
 
-        # Simulate error response if random chance triggers it.
-        if random.random() < self.config.get("error_probability", 0.0):
-            error_text = "ERR_DISCONNECTED"
-            self.logger.debug(f"Simulated error response: {error_text}")
-            return GaugeResponse(raw_data=error_text.encode("utf-8"),
-                                 formatted_data=error_text,
+        # Simulate error response if random chance triggers it; with no error
+        # probability configured the random draw is skipped entirely.
+        if self._error_prob > 0.0 and random.random() < self._error_prob:
+            self.logger.debug("Simulated error response: %s", _ERROR_TEXT)
+            return GaugeResponse(raw_data=_ERROR_RAW,
+                                 formatted_data=_ERROR_TEXT,
                                  success=False,
-                                 error_message=error_text)
+                                 error_message=_ERROR_TEXT)
 
-        # Handle gauge simulation.
-        if self.device_type == "gauge":
-            gauge_type = self.config.get("gauge_type", "PPG550")
-            if gauge_type.startswith("CDG"):
-                # Produce a constant 9-byte CDG frame.
-                start_byte = 0x07
-                page = 0x01
-                status = 0x00
-                error = 0x00
-                # Use current pressure state converted to an integer (simulate fixed measurement).
-                measurement = int(self.state.get("pressure", 30000))
-                meas_bytes = measurement.to_bytes(2, byteorder="big", signed=True)
-                cmd_code = 0x00
-                sensor_type = 0x00
-                frame = bytearray([start_byte, page, status, error])
-                frame.extend(meas_bytes)
-                frame.extend([cmd_code, sensor_type])
-                checksum = sum(frame[1:8]) & 0xFF
-                frame.append(checksum)
-                simulated_raw = bytes(frame)
-                formatted = " ".join(f"{b:02X}" for b in simulated_raw)
-                self.logger.debug(f"Simulated CDG frame: {formatted}")
-                return GaugeResponse(raw_data=simulated_raw, formatted_data=formatted, success=True)
-            else:
-                # For non-CDG gauges, support both read and set commands.
-                if command.command_type == "!":
-                    if command.name == "data_tx_mode":
-                        new_val = command.parameters.get("value", "0")
-                        self.state["data_tx_mode"] = new_val
-                        response_data = f"DataTxMode set to {new_val}"
-                    elif command.name == "set_pressure":
-                        try:
-                            new_pressure = float(command.parameters.get("value", 0))
-                            self.state["pressure"] = new_pressure
-                            response_data = f"Pressure set to {new_pressure:.2f} psi"
-                        except Exception as e:
-                            response_data = f"Error: Invalid pressure value ({e})"
-                    elif command.name == "set_temperature":
-                        try:
-                            new_temp = float(command.parameters.get("value", 0))
-                            self.state["temperature"] = new_temp
-                            response_data = f"Temperature set to {new_temp:.1f}°C"
-                        except Exception as e:
-                            response_data = f"Error: Invalid temperature value ({e})"
-                    elif command.name == "calibrate":
-                        # Simulate calibration delay and acknowledgement.
-                        time.sleep(2.0 + random.uniform(-0.1, 0.1))
-                        response_data = "Calibration successful"
-                    else:
-                        response_data = f"{command.name} executed successfully"
-                else:
-                    if command.name == "pressure":
-                        base = random.uniform(*self.config.get("pressure_range", (0.1, 1000)))
-                        noise = base * self.config.get("noise_level", 0.05)
-                        self.state["pressure"] = base + random.uniform(-noise, noise)
-                        response_data = f"{self.state['pressure']:.2f} psi"
-                    elif command.name == "temperature":
-                        base = random.uniform(*self.config.get("temp_range", (-50, 300)))
-                        noise = base * self.config.get("noise_level", 0.05)
-                        self.state["temperature"] = base + random.uniform(-noise, noise)
-                        response_data = f"{self.state['temperature']:.1f}°C"
-                    else:
-                        response_data = f"{command.name} executed successfully"
-                simulated_raw = response_data.encode("utf-8")
-                self.logger.debug(f"Simulated response: {response_data}")
-                return GaugeResponse(raw_data=simulated_raw, formatted_data=response_data, success=True)
-
-        elif self.device_type == "turbo":
-            # For turbo simulation, ignore port issues.
-            if command.command_type == "!":
-                if command.name == "set_speed":
-                    try:
-                        new_speed = int(command.parameters.get("value", 0))
-                        low, high = self.config.get("speed_range", (1000, 5000))
-                        if new_speed < low or new_speed > high:
-                            response_data = f"Error: Speed out of range ({low}-{high} RPM)"
-                        else:
-                            self.state["speed"] = new_speed
-                            response_data = f"Speed set to {new_speed} RPM"
-                    except Exception as e:
-                        response_data = f"Error: Invalid speed value ({e})"
-                elif command.name == "motor_on":
-                    if command.command_type == "!":
-                        value = command.parameters.get("value")
-                        self.state["motor_on"] = (value == "1")
-                        response_data = f"Motor set to {'On' if self.state['motor_on'] else 'Off'}"
-                    else:
-                        response_data = "On" if self.state.get("motor_on", False) else "Off"
-                else:
-                    response_data = f"{command.name} executed successfully"
-            else:
-                if command.name == "get_speed":
-                    response_data = f"{self.state.get('speed', 0)} RPM"
-                else:
-                    response_data = f"{command.name} executed successfully"
-            simulated_raw = response_data.encode("utf-8")
-            self.logger.debug(f"Simulated turbo response: {response_data}")
-            return GaugeResponse(raw_data=simulated_raw, formatted_data=response_data, success=True)
+        # CDG gauges answer every command with their continuous output frame.
+        if self._cdg_frame is not None:
+            return self._sim_cdg_frame()
 
+        handlers = self._write_handlers if command.command_type == "!" else self._read_handlers
+        handler = handlers.get(command.name)
+        if handler is None:
+            response_data, simulated_raw = _acknowledgement(command.name)
         else:
-            response_data = f"{command.name} executed successfully"
+            response_data = handler(command)
             simulated_raw = response_data.encode("utf-8")
-            self.logger.debug(f"Simulated response: {response_data}")
-            return GaugeResponse(raw_data=simulated_raw, formatted_data=response_data, success=True)
-
-    def read_continuous(self, callback: Callable[[GaugeResponse], None], update_interval: float) -> None:
-        while self.connected:
-            response = self.send_command(GaugeCommand(name="pressure", command_type="?"))
-            callback(response)
-            time.sleep(update_interval)
+        self.logger.debug("%s: %s", self._response_log, response_data)
+        return GaugeResponse(raw_data=simulated_raw, formatted_data=response_data, success=True)
+
+    def _sim_cdg_frame(self) -> GaugeResponse:
+        # Use current pressure state as a 16-bit integer (simulate fixed measurement).
+        measurement = self.state.pressure_i16
+        payload = self._cdg_payload
+        if payload is None or measurement != self._cdg_measurement:
+            # Produce a constant 9-byte CDG frame from the cached template.
+            frame = self._cdg_frame
+            _PACK_CDG_MEASUREMENT(frame, 4, measurement)
+            frame[8] = (_CDG_FIXED_SUM + frame[4] + frame[5]) & 0xFF
+            simulated_raw = bytes(frame)
+            payload = self._cdg_payload = (simulated_raw, simulated_raw.hex(" ").upper())
+            self._cdg_measurement = measurement
+        simulated_raw, formatted = payload
+        self.logger.debug("Simulated CDG frame: %s", formatted)
+        # Consumers may modify the response they get, so each call gets its own.
+        return GaugeResponse(raw_data=simulated_raw, formatted_data=formatted, success=True)
+
+    # --- Gauge command handlers ---
+
+    def _sim_pressure(self, command: GaugeCommand) -> str:
+        base = self._pressure_lo + self._pressure_span * _random()
+        pressure = base + base * self._noise_level * (2.0 * _random() - 1.0)
+        self.state.set_pressure(pressure)
+        return f"{pressure:.2f} psi"
+
+    def _sim_temperature(self, command: GaugeCommand) -> str:
+        base = self._temp_lo + self._temp_span * _random()
+        temperature = self.state.temperature = base + base * self._noise_level * (2.0 * _random() - 1.0)
+        return f"{temperature:.1f}°C"
+
+    def _sim_data_tx_mode(self, command: GaugeCommand) -> str:
+        new_val = command.parameters.get("value", "0")
+        self.state.data_tx_mode = new_val
+        return f"DataTxMode set to {new_val}"
+
+    def _sim_set_pressure(self, command: GaugeCommand) -> str:
+        try:
+            new_pressure = float(command.parameters.get("value", 0))
+            self.state.set_pressure(new_pressure)
+            return f"Pressure set to {new_pressure:.2f} psi"
+        except Exception as e:
+            return f"Error: Invalid pressure value ({e})"
+
+    def _sim_set_temperature(self, command: GaugeCommand) -> str:
+        try:
+            new_temp = float(command.parameters.get("value", 0))
+            self.state.temperature = new_temp
+            return f"Temperature set to {new_temp:.1f}°C"
+        except Exception as e:
+            return f"Error: Invalid temperature value ({e})"
+
+    def _sim_calibrate(self, command: GaugeCommand) -> str:
+        # Simulate calibration delay and acknowledgement.
+        time.sleep(2.0 + random.uniform(-0.1, 0.1))
+        return "Calibration successful"
+
+    # --- Turbo command handlers ---
+
+    def _sim_get_speed(self, command: GaugeCommand) -> str:
+        return f"{self.state.speed} RPM"
+
+    def _sim_set_speed(self, command: GaugeCommand) -> str:
+        try:
+            new_speed = int(command.parameters.get("value", 0))
+            low, high = self._speed_lo, self._speed_hi
+            if new_speed < low or new_speed > high:
+                return f"Error: Speed out of range ({low}-{high} RPM)"
+            self.state.speed = new_speed
+            return f"Speed set to {new_speed} RPM"
+        except Exception as e:
+            return f"Error: Invalid speed value ({e})"
+
+    def _sim_motor_on(self, command: GaugeCommand) -> str:
+        value = command.parameters.get("value")
+        self.state.motor_on = (value == "1")
+        return f"Motor set to {'On' if self.state.motor_on else 'Off'}"
+
+    def read_continuous(self, callback: Callable[[Any], None], update_interval: float,
+                        batch_size: int = 1) -> None:
+        """
+        Produces simulated pressure readings until continuous reading is stopped or
+        the simulator is disconnected.
+
+        Args:
+            callback: Called with each GaugeResponse, or with a list of batch_size
+                responses when batch_size is greater than 1.
+            update_interval: The time (in seconds) between readings.
+            batch_size: Number of readings delivered per callback; batches are
+                delivered every update_interval * batch_size seconds.
+        """
+        command = GaugeCommand(name="pressure", command_type="?")
+        respond = self._respond
+        period = update_interval * batch_size
+        # Readings are scheduled against monotonic deadlines so the interval does not
+        # drift by the time spent producing each response and running the callback.
+        # The stop event is only cleared by connect() and set_continuous_reading(True),
+        # so a stop requested before this thread gets here is not lost.
+        stop_event = self._stop_event
+        deadline = time.monotonic()
+        while self.connected and not stop_event.is_set():
+            if batch_size > 1:
+                callback([respond(command, False) for _ in range(batch_size)])
+            else:
+                callback(respond(command, False))
+            deadline += period
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                # Returns early as soon as a stop is requested.
+                stop_event.wait(remaining)
+            else:
+                # Fell behind (e.g. a slow callback); restart the schedule from now.
+                deadline -= remaining
@@ -5,9 +5,9 @@ Defines command definitions for BCG450 combination gauges.
 Each command is defined using the CommandDefinition data class.
 """
 
-from serial_communication.param_types import CommandDefinition, ParamType
+from serial_communication.param_types import CommandDefinition, CommandSet, ParamType
 
-class BCG450Command:
+class BCG450Command(CommandSet):
     """
     Contains command definitions for the BCG450 combination gauge.
     """
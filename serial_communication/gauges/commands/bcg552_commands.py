@@ -5,11 +5,12 @@ Defines command definitions for BCG552 triple gauge devices.
 Each command is standardized using the CommandDefinition data class.
 """
 
+from serial_communication.gauges.commands.pfeiffer_commands import PfeifferCommonCommands
 from serial_communication.param_types import CommandDefinition, ParamType
 
-class BCG552Command:
+class BCG552Command(PfeifferCommonCommands):
     """
-    Contains command definitions for BCG552 triple gauge devices.
+    Contains the gauge-specific command definitions for BCG552 triple gauge devices.
     """
     PRESSURE = CommandDefinition(
         pid=221,
@@ -20,14 +21,6 @@ class BCG552Command:
         continuous=True
     )
 
-    TEMPERATURE = CommandDefinition(
-        pid=222,
-        name="temperature",
-        description="Read sensor temperature",
-        read=True,
-        write=False
-    )
-
     ZERO_ADJUST = CommandDefinition(
         pid=417,
         name="zero_adjust",
@@ -35,27 +28,3 @@ class BCG552Command:
         read=False,
         write=True
     )
-
-    SOFTWARE_VERSION = CommandDefinition(
-        pid=218,
-        name="software_version",
-        description="Read software version",
-        read=True,
-        write=False
-    )
-
-    SERIAL_NUMBER = CommandDefinition(
-        pid=207,
-        name="serial_number",
-        description="Read serial number",
-        read=True,
-        write=False
-    )
-
-    ERROR_STATUS = CommandDefinition(
-        pid=228,
-        name="error_status",
-        description="Read error status",
-        read=True,
-        write=False
-    )
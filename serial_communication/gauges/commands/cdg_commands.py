@@ -5,9 +5,9 @@ Defines command definitions for CDG gauges (Capacitance Diaphragm Gauges)
 with additional support for model identification.
 """
 
-from serial_communication.param_types import CommandDefinition, ParamType
+from serial_communication.param_types import CommandDefinition, CommandSet, ParamType
 
-class CDGCommand:
+class CDGCommand(CommandSet):
     """
     Contains enhanced command definitions for all CDG gauge variants.
     """
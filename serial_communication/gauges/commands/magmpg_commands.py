@@ -5,9 +5,9 @@ Defines command definitions for MAG500 and MPG500 combination gauges.
 These definitions differ slightly between the two models.
 """
 
-from serial_communication.param_types import CommandDefinition
+from serial_communication.param_types import CommandDefinition, CommandSet
 
-class MAG500Command:
+class MAG500Command(CommandSet):
     """
     Command definitions specific to the MAG500 cold cathode gauge.
     """
@@ -22,7 +22,7 @@ class MAG500Command:
     CCIG_FULL_SCALE = CommandDefinition(503, "ccig_full_scale", "Read CCIG full scale", True, False)
     CCIG_SAFE_STATE = CommandDefinition(504, "ccig_safe_state", "Read CCIG safe state", True, False)
 
-class MPG500Command:
+class MPG500Command(CommandSet):
     """
     Command definitions specific to the MPG500 combination gauge.
     """
@@ -4,9 +4,9 @@ opg_commands.py
 Defines command definitions for the OPG550 optical plasma gauge.
 """
 
-from serial_communication.param_types import CommandDefinition
+from serial_communication.param_types import CommandDefinition, CommandSet
 
-class OPGCommand:
+class OPGCommand(CommandSet):
     """
     Contains command definitions for the OPG550 optical plasma gauge.
     """
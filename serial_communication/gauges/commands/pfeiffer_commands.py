@@ -0,0 +1,42 @@
+"""
+pfeiffer_commands.py
+
+Defines the command definitions shared by the Pfeiffer binary-protocol gauges
+(BCG552, BPG552, PCG550, PSG550). Gauge command classes inherit these and add
+their own commands.
+"""
+
+from serial_communication.param_types import CommandDefinition, CommandSet
+
+class PfeifferCommonCommands(CommandSet):
+    """
+    Contains the command definitions common to the Pfeiffer binary-protocol gauges.
+    """
+    TEMPERATURE = CommandDefinition(
+        pid=222,
+        name="temperature",
+        description="Read sensor temperature",
+        read=True,
+        write=False
+    )
+    SOFTWARE_VERSION = CommandDefinition(
+        pid=218,
+        name="software_version",
+        description="Read software version",
+        read=True,
+        write=False
+    )
+    SERIAL_NUMBER = CommandDefinition(
+        pid=207,
+        name="serial_number",
+        description="Read serial number",
+        read=True,
+        write=False
+    )
+    ERROR_STATUS = CommandDefinition(
+        pid=228,
+        name="error_status",
+        description="Read error status",
+        read=True,
+        write=False
+    )
@@ -4,11 +4,12 @@ psg550_commands.py
 Defines command definitions for the PSG550 Pirani/Piezo combination gauge.
 """
 
+from serial_communication.gauges.commands.pfeiffer_commands import PfeifferCommonCommands
 from serial_communication.param_types import CommandDefinition, ParamType
 
-class PSG550Command:
+class PSG550Command(PfeifferCommonCommands):
     """
-    Contains command definitions for the PSG550 combination gauge.
+    Contains the gauge-specific command definitions for the PSG550 combination gauge.
     """
     PRESSURE = CommandDefinition(
         pid=221,
@@ -18,34 +19,6 @@ class PSG550Command:
         write=False,
         continuous=True
     )
-    TEMPERATURE = CommandDefinition(
-        pid=222,
-        name="temperature",
-        description="Read sensor temperature",
-        read=True,
-        write=False
-    )
-    SOFTWARE_VERSION = CommandDefinition(
-        pid=218,
-        name="software_version",
-        description="Read software version",
-        read=True,
-        write=False
-    )
-    SERIAL_NUMBER = CommandDefinition(
-        pid=207,
-        name="serial_number",
-        description="Read serial number",
-        read=True,
-        write=False
-    )
-    ERROR_STATUS = CommandDefinition(
-        pid=228,
-        name="error_status",
-        description="Read error status",
-        read=True,
-        write=False
-    )
     PIRANI_FULL_SCALE = CommandDefinition(
         pid=33000,
         name="pirani_full_scale",
@@ -13,11 +13,56 @@ Usage Example:
     response = protocol.parse_response(received_bytes)
 """
 
+import math
 import struct
 from typing import Dict, Any, List, Optional
 import logging
 from serial_communication.models import GaugeCommand, GaugeResponse
-from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
+from serial_communication.gauges.protocols.gauge_protocol import (
+    GaugeProtocol, LN10_OVER_2_26, decode_s32
+)
+
+# Command frame header: address, device ID, 0x00, length, command type, PID, two reserved bytes.
+_HEADER = struct.Struct(">5BH2x")
+_CRC = struct.Struct("<H")
+
+
+def _handle_pressure(data: bytes) -> Dict[str, Any]:
+    pressure = math.exp(decode_s32(data) * LN10_OVER_2_26)
+    return {"pressure": f"{pressure:.2e} mbar"}
+
+
+def _handle_temperature(data: bytes) -> Dict[str, Any]:
+    temp = decode_s32(data) / 100.0
+    return {"temperature": f"{temp:.1f}°C"}
+
+
+def _handle_status(data: bytes) -> Dict[str, Any]:
+    status = data[0]
+    return {
+        "status": {
+            "pirani": "ACTIVE" if status & 0x01 else "INACTIVE",
+            "ba": "ACTIVE" if status & 0x02 else "INACTIVE",
+            "degas": "ON" if status & 0x08 else "OFF"
+        }
+    }
+
+
+def _handle_control(data: bytes) -> Dict[str, Any]:
+    return {"result": "Command executed successfully"}
+
+
+def _handle_raw(data: bytes) -> Dict[str, Any]:
+    return {"value": data.hex(' ').upper()}
+
+
+# Response parsers keyed by the command definition's response_type.
+_HANDLERS = {
+    "pressure": _handle_pressure,
+    "temperature": _handle_temperature,
+    "status": _handle_status,
+    "control": _handle_control,
+}
 
 class BCG450Protocol(GaugeProtocol):
     """
@@ -37,6 +82,8 @@ class BCG450Protocol(GaugeProtocol):
         self._response_validation_enabled = True
         self.rs485_mode = False
         self._last_command = None
+        # Finished frames keyed by (command name, first frame byte, parameter byte).
+        self._frame_cache: Dict[tuple, bytes] = {}
         self.logger.debug("Initialized BCG450 protocol handler")
 
     def _initialize_commands(self) -> None:
@@ -104,6 +151,9 @@ class BCG450Protocol(GaugeProtocol):
         The frame is structured as follows:
           [Address, Device ID, 0x00, Length, Command Type, PID MSB, PID LSB, Reserved, Reserved, CRC16]
 
+        Frames depend only on the command, the address byte and the optional parameter
+        byte, so each distinct frame is built and checksummed once and then reused.
+
         Args:
             command (GaugeCommand): The command to serialize.
 
@@ -115,26 +165,33 @@ class BCG450Protocol(GaugeProtocol):
             raise ValueError(f"Unknown command: {command.name}")
         self._last_command = command.name
 
-        msg = bytearray([
-            self.address if self.rs485_mode else 0x00,
+        param = None
+        if command.command_type == "!" and cmd_info.get("parameters", False):
+            # Here we assume a single-byte parameter; extend conversion as needed.
+            param = int(command.parameters.get("value", 0)) & 0xFF
+        address = self.address if self.rs485_mode else 0x00
+        key = (command.name, address, param)
+        frame = self._frame_cache.get(key)
+        if frame is not None:
+            return frame
+
+        size = _HEADER.size if param is None else _HEADER.size + 1
+        msg = bytearray(size + _CRC.size)
+        _HEADER.pack_into(
+            msg, 0,
+            address,
             self.device_id,
             0x00,
-            0x05,  # Default length; may be updated if parameters are appended.
+            size - 4,  # Length counts the bytes after the length field.
             0x01 if cmd_info["cmd"] == 1 else 0x03,
-            (cmd_info["pid"] >> 8) & 0xFF,
-            cmd_info["pid"] & 0xFF,
-            0x00, 0x00
-        ])
-
-        if command.command_type == "!" and cmd_info.get("parameters", False):
-            value = command.parameters.get("value", 0)
-            # Here we assume a single-byte parameter; extend conversion as needed.
-            msg.extend([int(value) & 0xFF])
-            msg[3] = len(msg) - 4
+            cmd_info["pid"]
+        )
+        if param is not None:
+            msg[_HEADER.size] = param
 
-        crc = self.calculate_crc16(msg)
-        msg.extend([crc & 0xFF, (crc >> 8) & 0xFF])
-        return bytes(msg)
+        _CRC.pack_into(msg, size, self.calculate_crc16(memoryview(msg)[:size]))
+        frame = self._frame_cache[key] = bytes(msg)
+        return frame
 
     def parse_response(self, response: bytes) -> GaugeResponse:
         """
@@ -184,28 +241,8 @@ class BCG450Protocol(GaugeProtocol):
         if not cmd_info:
             return {"raw_data": data.hex(' ').upper()}
 
-        response_type = cmd_info.get("response_type", "raw")
-        if response_type == "pressure":
-            value = int.from_bytes(data, byteorder="big", signed=True)
-            pressure = 10 ** (value / (2 ** 26))
-            return {"pressure": f"{pressure:.2e} mbar"}
-        elif response_type == "temperature":
-            value = int.from_bytes(data, byteorder="big", signed=True)
-            temp = value / 100.0
-            return {"temperature": f"{temp:.1f}°C"}
-        elif response_type == "status":
-            status = data[0]
-            return {
-                "status": {
-                    "pirani": "ACTIVE" if status & 0x01 else "INACTIVE",
-                    "ba": "ACTIVE" if status & 0x02 else "INACTIVE",
-                    "degas": "ON" if status & 0x08 else "OFF"
-                }
-            }
-        elif response_type == "control":
-            return {"result": "Command executed successfully"}
-        else:
-            return {"value": data.hex(' ').upper()}
+        handler = _HANDLERS.get(cmd_info.get("response_type"), _handle_raw)
+        return handler(data)
 
     def _create_error_response(self, message: str, response: bytes) -> GaugeResponse:
         """
@@ -2,11 +2,14 @@
 Implements the protocol logic for BCG552 TripleGauge.
 """
 
+import math
 import struct
 from typing import Dict, Any
 
 from serial_communication.gauges.commands.bcg552_commands import BCG552Command
-from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
+from serial_communication.gauges.protocols.gauge_protocol import (
+    GaugeProtocol, LN10_OVER_2_26, decode_s32
+)
 from serial_communication.models import GaugeCommand
 from serial_communication.param_types import ParamType
 
@@ -17,9 +20,7 @@ class BCG552Protocol(GaugeProtocol):
     """
 
     def _initialize_commands(self):
-        for cmd in vars(BCG552Command).values():
-            if hasattr(cmd, 'pid'):
-                self._command_defs[cmd.name] = cmd
+        self._command_defs = BCG552Command.by_name
 
     def create_command(self, command: GaugeCommand) -> bytes:
         cmd_def = self._command_defs.get(command.name)
@@ -71,8 +72,8 @@ class BCG552Protocol(GaugeProtocol):
     def _parse_data(self, pid: int, data: bytes) -> Dict[str, Any]:
         if pid == BCG552Command.PRESSURE.pid:
             # LogFixs32en26 format
-            value = int.from_bytes(data, byteorder='big', signed=True)
-            pressure = 10 ** (value / (2 ** 26))
+            value = decode_s32(data)
+            pressure = math.exp(value * LN10_OVER_2_26)
             return {"success": True, "pressure": pressure, "unit": "mbar"}
 
         elif pid == BCG552Command.TEMPERATURE.pid:
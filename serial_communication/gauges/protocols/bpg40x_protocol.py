@@ -2,10 +2,13 @@
 Implements protocol logic for BPG40x hot cathode gauges.
 """
 
+import math
 import struct
 from typing import Dict, Any
 
-from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
+from serial_communication.gauges.protocols.gauge_protocol import (
+    GaugeProtocol, LN10_OVER_2_26, decode_s32
+)
 from serial_communication.models import GaugeCommand
 from serial_communication.param_types import CommandDefinition, ParamType
 
@@ -73,8 +76,8 @@ class BPG40xProtocol(GaugeProtocol):
     def _parse_data(self, pid: int, data: bytes) -> Dict[str, Any]:
         if pid == 221:
             # Pressure in LogFixs32en26
-            value = int.from_bytes(data, byteorder='big', signed=True)
-            pressure = 10 ** (value / (2 ** 26))
+            value = decode_s32(data)
+            pressure = math.exp(value * LN10_OVER_2_26)
             return {"success": True, "pressure": pressure, "unit": "mbar"}
         elif pid == 533:
             status = data[0]
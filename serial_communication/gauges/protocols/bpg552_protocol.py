@@ -2,11 +2,14 @@
 Implements the protocol logic for BPG552 DualGauge.
 """
 
+import math
 import struct
 from typing import Dict, Any, Optional
 
 from serial_communication.gauges.commands.bpg552_commands import BPG552Command
-from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
+from serial_communication.gauges.protocols.gauge_protocol import (
+    GaugeProtocol, LN10_OVER_2_26, decode_s32
+)
 from serial_communication.models import GaugeCommand
 from serial_communication.param_types import ParamType
 
@@ -18,9 +21,7 @@ class BPG552Protocol(GaugeProtocol):
 
     def _initialize_commands(self):
         # Adds user interface button for each BPG552Command definition
-        for cmd in vars(BPG552Command).values():
-            if hasattr(cmd, "pid"):
-                self._command_defs[cmd.name] = cmd
+        self._command_defs = BPG552Command.by_name
 
     def create_command(self, command: GaugeCommand) -> bytes:
         cmd_def = self._command_defs.get(command.name)
@@ -76,8 +77,8 @@ class BPG552Protocol(GaugeProtocol):
     def _parse_data(self, pid: int, data: bytes) -> Dict[str, Any]:
         if pid == BPG552Command.PRESSURE.pid:
             # Reads pressure from LogFixs32en26 format
-            value = int.from_bytes(data, byteorder="big", signed=True)
-            pressure = 10 ** (value / (2 ** 26))
+            value = decode_s32(data)
+            pressure = math.exp(value * LN10_OVER_2_26)
             return {"success": True, "pressure": pressure, "unit": "mbar"}
 
         elif pid == BPG552Command.TEMPERATURE.pid:
@@ -17,12 +17,36 @@ Usage Example:
     response = protocol.parse_response(received_bytes)
 """
 
+import binascii
 import logging
+import math
+import struct
 from abc import ABC, abstractmethod
 from typing import Optional
 
 from serial_communication.models import GaugeCommand, GaugeResponse
 
+# Precompiled unpacker for 4-byte signed big-endian payloads (pressure and temperature values).
+_S32_BE = struct.Struct(">i")
+
+# LogFixs32en26 decodes as 10 ** (value / 2**26); exp(value * LN10_OVER_2_26) is the same in one libm call.
+LN10_OVER_2_26 = math.log(10.0) / (1 << 26)
+
+
+def decode_s32(data: bytes) -> int:
+    """
+    Decodes a signed big-endian integer payload.
+
+    Args:
+        data (bytes): The payload; 4 bytes in well-formed responses.
+
+    Returns:
+        int: The decoded value.
+    """
+    if len(data) == 4:
+        return _S32_BE.unpack(data)[0]
+    return int.from_bytes(data, byteorder="big", signed=True)
+
 
 class GaugeProtocol(ABC):
     """
@@ -97,13 +121,5 @@ class GaugeProtocol(ABC):
         Returns:
             int: The 16-bit CRC checksum.
         """
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= (byte << 8)
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021
-                else:
-                    crc <<= 1
-            crc &= 0xFFFF
-        return crc
+        # binascii.crc_hqx is the CCITT polynomial 0x1021, MSB first, computed in C.
+        return binascii.crc_hqx(data, 0xFFFF)
@@ -2,11 +2,14 @@
 Implements protocol logic for MAG500 and MPG500 combination gauges.
 """
 
+import math
 import struct
 from typing import Dict, Any, Optional
 
 from serial_communication.gauges.commands.magmpg_commands import MAG500Command, MPG500Command
-from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
+from serial_communication.gauges.protocols.gauge_protocol import (
+    GaugeProtocol, LN10_OVER_2_26, decode_s32
+)
 from serial_communication.models import GaugeCommand
 from serial_communication.param_types import ParamType
 
@@ -17,15 +20,14 @@ class MAGMPGProtocol(GaugeProtocol):
     """
 
     def __init__(self, device_id: int = 0x14, address: int = 254, logger: Optional[object] = None):
-        super().__init__(address, logger)
+        # Set before the base initializer, which calls _initialize_commands().
         self.device_id = device_id
+        super().__init__(address, logger)
 
     def _initialize_commands(self):
         # Chooses command set based on device_id
         command_class = MAG500Command if self.device_id == 0x14 else MPG500Command
-        for cmd in vars(command_class).values():
-            if hasattr(cmd, "pid"):
-                self._command_defs[cmd.name] = cmd
+        self._command_defs = command_class.by_name
 
     def create_command(self, command: GaugeCommand) -> bytes:
         cmd_def = self._command_defs.get(command.name)
@@ -76,8 +78,8 @@ class MAGMPGProtocol(GaugeProtocol):
 
     def _parse_data(self, pid: int, data: bytes) -> Dict[str, Any]:
         if pid == 221:  # pressure
-            value = int.from_bytes(data, byteorder='big', signed=True)
-            pressure = 10 ** (value / (2 ** 26))
+            value = decode_s32(data)
+            pressure = math.exp(value * LN10_OVER_2_26)
             return {"success": True, "pressure": pressure, "unit": "mbar"}
         elif pid == 222:  # temperature
             temp = struct.unpack('>f', data)[0]
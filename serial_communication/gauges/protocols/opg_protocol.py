@@ -21,9 +21,7 @@ class OPGProtocol(GaugeProtocol):
         self.device_id = 0x0B  # OPG device ID
 
     def _initialize_commands(self):
-        for cmd in vars(OPGCommand).values():
-            if hasattr(cmd, "pid"):
-                self._command_defs[cmd.name] = cmd
+        self._command_defs = OPGCommand.by_name
 
     def create_command(self, command: GaugeCommand) -> bytes:
         cmd_def = self._command_defs.get(command.name)
@@ -4,7 +4,7 @@ Implements protocol logic for PCG550 Pirani/Capacitive combination gauge.
 import struct
 from typing import Dict, Any, Optional
 
-from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
+from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol, decode_s32
 from serial_communication.models import GaugeCommand
 from serial_communication.param_types import ParamType
 
@@ -68,7 +68,7 @@ class PCG550Protocol(GaugeProtocol):
 
     def _parse_data(self, pid: int, data: bytes) -> Dict[str, Any]:
         if pid == 221:  # Pressure (Fixs32en20 format)
-            value = int.from_bytes(data, byteorder='big', signed=True)
+            value = decode_s32(data)
             pressure = value / (2 ** 20)
             return {"success": True, "pressure": pressure, "unit": "mbar"}
 
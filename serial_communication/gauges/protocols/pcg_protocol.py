@@ -8,7 +8,7 @@ import struct   # Used for packing/unpacking binary data
 from typing import Dict, Any, Optional
 
 # Imports the base class for all protocols
-from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol
+from serial_communication.gauges.protocols.gauge_protocol import GaugeProtocol, decode_s32
 from serial_communication.models import GaugeCommand
 from serial_communication.param_types import CommandDefinition, ParamType
 
@@ -115,7 +115,7 @@ class PCGProtocol(GaugeProtocol):
         # Example for PID=221 => Pressure
         if pid == 221:
             # Fixs32en20 means it's a 32-bit signed int, fraction is 2^20
-            value = int.from_bytes(data, byteorder='big', signed=True)
+            value = decode_s32(data)
             pressure = 10 ** (value / (2 ** 20))  # or other formula
             return {"success": True, "pressure": pressure, "unit": "mbar"}
 
@@ -5,9 +5,11 @@ Defines parameter types and a data class for command definitions.
 This file standardizes the types of parameters used across all gauge commands.
 """
 
+import sys
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Union
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple, Union
 
 class ParamType(Enum):
     """
@@ -20,10 +22,15 @@ class ParamType(Enum):
     STRING = "string"
     BOOL = "bool"
 
-@dataclass
+# __slots__ generation for dataclasses is only available from Python 3.10.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CommandDefinition:
     """
-    Data class representing a command definition for a gauge.
+    Immutable data class representing a command definition for a gauge.
+    Command names are interned so lookups by name compare by identity.
 
     Attributes:
         pid: The parameter ID (PID) used in binary protocols.
@@ -47,3 +54,39 @@ class CommandDefinition:
     min_value: Optional[Union[int, float]] = None
     max_value: Optional[Union[int, float]] = None
     units: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+
+
+class CommandSet:
+    """
+    Base class for per-gauge command classes that declare their commands as
+    CommandDefinition class attributes.
+
+    The lookup tables are built once when a subclass is defined and shared, read-only,
+    by every protocol instance that uses the command set.
+
+    Attributes:
+        commands: All command definitions, inherited ones first, in declaration order.
+        by_name: Command definitions keyed by command name.
+        by_pid: Command definitions keyed by PID (the first definition wins if PIDs repeat).
+    """
+    commands: Tuple[CommandDefinition, ...] = ()
+    by_name: Mapping[str, CommandDefinition] = MappingProxyType({})
+    by_pid: Mapping[int, CommandDefinition] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Walk the MRO so commands inherited from a shared base class are included;
+        # a subclass attribute of the same name replaces the inherited definition.
+        namespace = {}
+        for klass in reversed(cls.__mro__):
+            namespace.update(vars(klass))
+        commands = tuple(value for value in namespace.values() if isinstance(value, CommandDefinition))
+        by_pid = {}
+        for cmd in commands:
+            by_pid.setdefault(cmd.pid, cmd)
+        cls.commands = commands
+        cls.by_name = MappingProxyType({cmd.name: cmd for cmd in commands})
+        cls.by_pid = MappingProxyType(by_pid)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+test_config.py
+
+Unit tests for the gauge configuration tables and logging setup.
+Run with: python -m unittest serial_communication.test_config
+"""
+
+import sys
+import unittest
+
+import serial
+
+from serial_communication import config
+from serial_communication.communicator.gauge_communicator import GaugeCommunicator
+
+
+class FrozenTablesTest(unittest.TestCase):
+    def test_tables_are_read_only_at_every_level(self):
+        ppg = config.GAUGE_PARAMETERS["PPG550"]
+        for table, key in ((config.GAUGE_PARAMETERS, "NEW"), (ppg, "baudrate"),
+                           (ppg["commands"]["pressure"], "cmd"), (config.GAUGE_OUTPUT_FORMATS, "PPG550")):
+            with self.subTest(key=key):
+                with self.assertRaises(TypeError):
+                    table[key] = None
+
+    def test_strings_are_interned(self):
+        cmd = config.GAUGE_PARAMETERS["PPG550"]["commands"]["pressure"]["cmd"]
+        self.assertIs(cmd, sys.intern("".join(["PR", "3"])))
+
+    def test_shared_descriptors_are_one_view(self):
+        params = config.GAUGE_PARAMETERS
+        self.assertIs(params["PCG550"]["commands"]["temperature"], params["MPG500"]["commands"]["temperature"])
+        self.assertIs(params["CDG025D"]["commands"]["pressure"], params["CDG045D"]["commands"]["pressure"])
+        self.assertEqual(list(params["PSG550"]["commands"])[:2], ["pressure", "temperature"])
+        self.assertEqual(list(params["PSG550"]["commands"])[-2:], ["pirani_full_scale", "pirani_adjust"])
+
+    def test_copies_are_mutable(self):
+        commands = dict(config.GAUGE_PARAMETERS["CDG045D"]["commands"])
+        commands["extra"] = {"cmd": "read"}
+        self.assertNotIn("extra", config.GAUGE_PARAMETERS["CDG045D"]["commands"])
+
+
+
+class SetupLoggingTest(unittest.TestCase):
+    def test_repeat_calls_keep_one_handler(self):
+        name = "serial_communication.test_config.SetupLoggingTest"
+        first = config.setup_logging(name)
+        second = config.setup_logging(name)
+        self.assertIs(first, second)
+        self.assertEqual(len(second.handlers), 1)
+        self.assertIs(second.handlers[0].formatter, config._LOG_FORMATTER)
+
+
+
+class SerialKwargsTest(unittest.TestCase):
+    def test_defaults_and_overrides(self):
+        ppg = config.GAUGE_SERIAL_KWARGS["PPG550"]
+        self.assertEqual(dict(ppg), {
+            "bytesize": serial.EIGHTBITS, "parity": serial.PARITY_NONE, "stopbits": serial.STOPBITS_ONE,
+            "timeout": 1.0, "write_timeout": 1.0, "baudrate": 9600,
+        })
+        self.assertEqual(config.GAUGE_SERIAL_KWARGS["PCG550"]["timeout"], 2)
+        self.assertEqual(set(config.GAUGE_SERIAL_KWARGS), set(config.GAUGE_PARAMETERS))
+
+    def test_communicator_interns_the_gauge_type(self):
+        gauge_type = "".join(["PCG", "550"])
+        communicator = GaugeCommunicator("TEST", gauge_type)
+        self.assertIs(communicator.gauge_type, next(key for key in config.GAUGE_PARAMETERS if key == gauge_type))
+
+    def test_communicator_uses_the_precomputed_settings(self):
+        communicator = GaugeCommunicator("TEST", "PCG550")
+        self.assertEqual((communicator.baudrate, communicator.timeout), (57600, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+test_device_simulator.py
+
+Unit tests for the DeviceSimulator's continuous reading and configuration handling.
+Run with: python -m unittest serial_communication.test_device_simulator
+"""
+
+import time
+import unittest
+from unittest import mock
+
+from serial_communication import device_simulator
+from serial_communication.config import GAUGE_PARAMETERS
+from serial_communication.device_simulator import DeviceSimulator, DummyProtocol, GaugeState, TurboState
+from serial_communication.models import GaugeCommand
+
+
+def _make_simulator(**overrides) -> DeviceSimulator:
+    config = {
+        "gauge_type": "PPG550",
+        "pressure_range": (0.1, 1000),
+        "temp_range": (-50, 300),
+        "noise_level": 0.05,
+        "response_delay": 0.0,
+        "error_probability": 0.0
+    }
+    config.update(overrides)
+    simulator = DeviceSimulator(device_type="gauge", config=config)
+    simulator.connect()
+    return simulator
+
+
+class ContinuousReadingTest(unittest.TestCase):
+    def test_stop_before_read_continuous_is_honoured(self):
+        simulator = _make_simulator()
+        simulator.set_continuous_reading(True)
+        simulator.set_continuous_reading(False)
+        readings = []
+        simulator.read_continuous(readings.append, 0.001)
+        self.assertEqual(readings, [])
+
+    def test_disconnect_stops_and_reconnect_rearms(self):
+        simulator = _make_simulator()
+        simulator.disconnect()
+        simulator.connect()
+        readings = []
+
+        def callback(response):
+            readings.append(response)
+            simulator.stop_continuous_reading()
+
+        simulator.read_continuous(callback, 0.001)
+        self.assertEqual(len(readings), 1)
+        self.assertTrue(readings[0].success)
+
+    def test_batched_readings(self):
+        simulator = _make_simulator()
+        batches = []
+
+        def callback(batch):
+            batches.append(batch)
+            if len(batches) == 2:
+                simulator.stop_continuous_reading()
+
+        simulator.read_continuous(callback, 0.001, batch_size=3)
+        self.assertEqual([len(batch) for batch in batches], [3, 3])
+        self.assertTrue(all(response.success for batch in batches for response in batch))
+
+    def test_interval_does_not_drift_with_callback_time(self):
+        simulator = _make_simulator()
+        times = []
+
+        def callback(response):
+            times.append(time.monotonic())
+            time.sleep(0.03)
+            if len(times) == 6:
+                simulator.stop_continuous_reading()
+
+        simulator.read_continuous(callback, 0.05)
+        # Five intervals take 0.25 s; drifting by the callback time would take 0.4 s.
+        self.assertLess(times[-1] - times[0], 0.35)
+        self.assertGreaterEqual(times[-1] - times[0], 0.24)
+
+    def test_manual_commands_keep_latency_during_continuous_reading(self):
+        simulator = _make_simulator(response_delay=0.05)
+        manual = []
+
+        def callback(response):
+            # A manual command issued while the continuous loop is running.
+            start = time.monotonic()
+            simulator.send_command(GaugeCommand(name="temperature", command_type="?"))
+            manual.append(time.monotonic() - start)
+            simulator.stop_continuous_reading()
+
+        simulator.read_continuous(callback, 0.001)
+        self.assertGreaterEqual(manual[0], 0.05)
+
+
+class UpdateConfigTest(unittest.TestCase):
+    def test_valid_update_is_applied(self):
+        simulator = _make_simulator()
+        simulator.update_config({"error_probability": 1.0})
+        self.assertEqual(simulator.config["error_probability"], 1.0)
+        response = simulator.send_command(GaugeCommand(name="pressure", command_type="?"))
+        self.assertFalse(response.success)
+
+    def test_no_error_draw_without_error_probability(self):
+        simulator = _make_simulator()
+        with mock.patch.object(device_simulator.random, "random", return_value=0.0) as draw:
+            response = simulator.send_command(GaugeCommand(name="unit", command_type="?"))
+        self.assertTrue(response.success)
+        draw.assert_not_called()
+
+    def test_response_delay_jitter(self):
+        simulator = _make_simulator(response_delay=0.05)
+        command = GaugeCommand(name="temperature", command_type="?")
+        with mock.patch.object(device_simulator.time, "sleep") as sleep:
+            simulator.send_command(command)
+            simulator.update_config({"latency_jitter": 0.01, "latency_distribution": "uniform"})
+            for _ in range(20):
+                simulator.send_command(command)
+        delays = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(delays[0], 0.05)
+        self.assertTrue(all(0.04 <= delay <= 0.06 for delay in delays[1:]), delays)
+        self.assertGreater(len(set(delays[1:])), 1)
+
+    def test_error_and_acknowledgement_replies(self):
+        simulator = _make_simulator(error_probability=1.0)
+        error = simulator.send_command(GaugeCommand(name="pressure", command_type="?"))
+        self.assertEqual((error.raw_data, error.formatted_data, error.error_message),
+                         (b"ERR_DISCONNECTED", "ERR_DISCONNECTED", "ERR_DISCONNECTED"))
+        simulator.update_config({"error_probability": 0.0})
+        first = simulator.send_command(GaugeCommand(name="zero_adjust", command_type="!"))
+        second = simulator.send_command(GaugeCommand(name="zero_adjust", command_type="!"))
+        self.assertEqual(first.raw_data, b"zero_adjust executed successfully")
+        self.assertIs(first.raw_data, second.raw_data)
+
+    def test_invalid_update_leaves_config_unchanged(self):
+        simulator = _make_simulator()
+        before = dict(simulator.config)
+        with self.assertRaises(ValueError):
+            simulator.update_config({"latency_distribution": "bogus", "error_probability": 1.0})
+        self.assertEqual(simulator.config, before)
+        # The rejected key is not kept, so later updates still succeed.
+        simulator.update_config({"latency_jitter": 0.0})
+        response = simulator.send_command(GaugeCommand(name="pressure", command_type="?"))
+        self.assertTrue(response.success)
+
+
+class CdgFrameTest(unittest.TestCase):
+    def _frame(self, simulator, pressure):
+        simulator.state.set_pressure(pressure)
+        return simulator.send_command(GaugeCommand(name="pressure", command_type="?")).raw_data
+
+    def test_frame_follows_the_pressure(self):
+        simulator = _make_simulator(gauge_type="CDG045D")
+        buffer = simulator._cdg_frame
+        self.assertEqual(self._frame(simulator, 300.7), bytes([0x07, 0x01, 0x00, 0x00, 0x01, 0x2C, 0x00, 0x00, 0x2E]))
+        self.assertEqual(self._frame(simulator, 2.0), bytes([0x07, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03]))
+        self.assertIs(simulator._cdg_frame, buffer)
+
+    def test_measurement_is_packed_signed_big_endian(self):
+        simulator = _make_simulator(gauge_type="CDG045D")
+        self.assertEqual(self._frame(simulator, -1.5)[4:6], b"\xff\xff")
+        self.assertEqual(self._frame(simulator, 258.9)[4:6], b"\x01\x02")
+        self.assertEqual(self._frame(simulator, -32768)[4:6], b"\x80\x00")
+
+    def test_out_of_range_pressure_saturates(self):
+        simulator = _make_simulator(gauge_type="CDG045D")
+        self.assertEqual(self._frame(simulator, 1e6)[4:6], b"\x7f\xff")
+        self.assertEqual(self._frame(simulator, -1e6)[4:6], b"\x80\x00")
+        self.assertEqual(simulator.state.pressure, -1e6)
+
+    def test_formatted_frame_is_uppercase_hex(self):
+        simulator = _make_simulator(gauge_type="CDG045D")
+        simulator.state.set_pressure(-2)
+        response = simulator.send_command(GaugeCommand(name="pressure", command_type="?"))
+        self.assertEqual(response.formatted_data, "07 01 00 00 FF FE 00 00 FE")
+
+    def test_checksum_matches_the_frame_bytes(self):
+        simulator = _make_simulator(gauge_type="CDG045D")
+        for pressure in (0, 1, 255, 256, 12345, 32767, -1, -300):
+            with self.subTest(pressure=pressure):
+                frame = self._frame(simulator, pressure)
+                self.assertEqual(frame[8], sum(frame[1:8]) & 0xFF)
+
+    def test_each_call_returns_its_own_response(self):
+        simulator = _make_simulator(gauge_type="CDG045D")
+        command = GaugeCommand(name="pressure", command_type="?")
+        first = simulator.send_command(command)
+        second = simulator.send_command(command)
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        first.formatted_data = "changed"
+        self.assertNotEqual(simulator.send_command(command).formatted_data, "changed")
+
+
+
+class CommandDispatchTest(unittest.TestCase):
+    def _send(self, simulator, name, command_type="?", **parameters):
+        return simulator.send_command(GaugeCommand(name=name, command_type=command_type, parameters=parameters))
+
+    def test_gauge_handlers(self):
+        simulator = _make_simulator()
+        self.assertEqual(self._send(simulator, "set_temperature", "!", value="25").formatted_data,
+                         "Temperature set to 25.0°C")
+        self.assertEqual(self._send(simulator, "data_tx_mode", "!", value="1").formatted_data, "DataTxMode set to 1")
+        self.assertEqual(simulator.state.data_tx_mode, "1")
+        # A write-only name sent as a read falls through to the generic acknowledgement.
+        self.assertEqual(self._send(simulator, "set_temperature").formatted_data,
+                         "set_temperature executed successfully")
+
+    def test_readings_stay_within_range_and_noise(self):
+        simulator = _make_simulator(pressure_range=(10.0, 20.0), temp_range=(20.0, 30.0), noise_level=0.1)
+        for _ in range(200):
+            pressure = float(self._send(simulator, "pressure").formatted_data.split()[0])
+            self.assertTrue(9.0 <= pressure <= 22.0, pressure)
+            self.assertEqual(round(simulator.state.pressure, 2), pressure)
+            temperature = float(self._send(simulator, "temperature").formatted_data.rstrip("°C"))
+            self.assertTrue(18.0 <= temperature <= 33.0, temperature)
+
+    def test_reply_text_matches_the_stored_reading(self):
+        simulator = _make_simulator()
+        self.assertEqual(self._send(simulator, "temperature").formatted_data, f"{simulator.state.temperature:.1f}°C")
+        self.assertEqual(self._send(simulator, "pressure").formatted_data, f"{simulator.state.pressure:.2f} psi")
+        response = self._send(simulator, "pressure")
+        self.assertEqual(response.raw_data, response.formatted_data.encode("utf-8"))
+
+    def test_turbo_handlers(self):
+        simulator = DeviceSimulator(device_type="turbo", config={"speed_range": (1000, 5000), "response_delay": 0})
+        simulator.connect()
+        self.assertEqual(self._send(simulator, "set_speed", "!", value="9000").formatted_data,
+                         "Error: Speed out of range (1000-5000 RPM)")
+        self.assertEqual(self._send(simulator, "set_speed", "!", value="3000").formatted_data, "Speed set to 3000 RPM")
+        self.assertEqual(self._send(simulator, "get_speed").formatted_data, "3000 RPM")
+        self.assertEqual(self._send(simulator, "motor_on", "!", value="1").formatted_data, "Motor set to On")
+
+
+
+class SlotsTest(unittest.TestCase):
+    def test_simulator_and_protocol_are_slotted(self):
+        simulator = _make_simulator()
+        for obj in (simulator, simulator.protocol):
+            with self.subTest(type=type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            simulator.outputformat = "Hex"
+
+    def test_state_dataclasses(self):
+        state = GaugeState(pressure=1.0, temperature=20.0, data_tx_mode="0")
+        self.assertFalse(hasattr(state, "__dict__"))
+        self.assertEqual(state, GaugeState(pressure=1.0, temperature=20.0, data_tx_mode="0"))
+        self.assertEqual(GaugeState(pressure=40000.0, temperature=0.0, data_tx_mode="0").pressure_i16, 32767)
+        turbo = TurboState(speed=1000, motor_on=False)
+        turbo.motor_on = True
+        self.assertEqual(turbo, TurboState(speed=1000, motor_on=True))
+        with self.assertRaises(AttributeError):
+            turbo.rpm = 1
+
+
+class DummyProtocolTest(unittest.TestCase):
+    def test_command_defs_come_from_the_config(self):
+        self.assertIs(DummyProtocol("CDG045D")._command_defs, GAUGE_PARAMETERS["CDG045D"]["commands"])
+        self.assertEqual(len(DummyProtocol("UNKNOWN")._command_defs), 0)
+        self.assertIs(_make_simulator(gauge_type="PPG570").protocol._command_defs,
+                      GAUGE_PARAMETERS["PPG570"]["commands"])
+
+
+
+class LoggingTest(unittest.TestCase):
+    def test_debug_messages_render_their_arguments(self):
+        simulator = _make_simulator()
+        with self.assertLogs(simulator.logger, level="DEBUG") as logs:
+            response = simulator.send_command(GaugeCommand(name="temperature", command_type="?"))
+        self.assertIn("DEBUG:DeviceSimulator:Simulated command received: temperature", logs.output)
+        self.assertIn(f"DEBUG:DeviceSimulator:Simulated response: {response.formatted_data}", logs.output)
+
+
+
+class ConnectLatencyTest(unittest.TestCase):
+    def test_latency_is_opt_in(self):
+        with mock.patch.object(device_simulator.time, "sleep") as sleep:
+            simulator = _make_simulator()
+            simulator.disconnect()
+            sleep.assert_not_called()
+            simulator.update_config({"connect_delay": 0.2, "disconnect_delay": 0.1})
+            simulator.connect()
+            simulator.disconnect()
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.2, 0.1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+test_gauge_communicator.py
+
+Unit tests for GaugeCommunicator's RS485 handling and the manual command exchange,
+using an in-memory stand-in for the serial port.
+Run with: python -m unittest serial_communication.test_gauge_communicator
+"""
+
+import logging
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from serial_communication.communicator import gauge_communicator, gauge_tester, intelligent_command_sender
+from serial_communication.communicator.gauge_communicator import GaugeCommunicator
+from serial_communication.communicator.gauge_tester import GaugeTester
+from serial_communication.communicator.intelligent_command_sender import IntelligentCommandSender
+
+
+class FakePort:
+    """
+    Minimal serial port: echoes every write back as the reply and records
+    RS485 and flush activity.
+    """
+
+    def __init__(self, rs485_error: Exception = None):
+        self.is_open = True
+        self.rts_levels = []
+        self.dtr = False
+        self.input = bytearray()
+        self.rs485_error = rs485_error
+        self.rs485_assignments = []
+        self._rs485_mode = None
+        self.input_resets = 0
+
+    @property
+    def rs485_mode(self):
+        return self._rs485_mode
+
+    @rs485_mode.setter
+    def rs485_mode(self, settings):
+        # Like pyserial, the value is stored before the driver is asked to apply it.
+        self._rs485_mode = settings
+        self.rs485_assignments.append(settings)
+        if settings is not None and self.rs485_error is not None:
+            raise self.rs485_error
+
+    def fileno(self) -> int:
+        return 99
+
+    def setDTR(self, level: bool) -> None:
+        self.dtr = level
+
+    @property
+    def rts(self) -> bool:
+        return self.rts_levels[-1] if self.rts_levels else False
+
+    @rts.setter
+    def rts(self, level: bool) -> None:
+        self.rts_levels.append(level)
+
+    def setRTS(self, level: bool) -> None:
+        self.rts = level
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.input)
+
+    def read(self, size: int) -> bytes:
+        data = bytes(self.input[:size])
+        del self.input[:size]
+        return data
+
+    def write(self, data: bytes) -> int:
+        self.input += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def reset_input_buffer(self) -> None:
+        self.input_resets += 1
+        self.input.clear()
+
+    def reset_output_buffer(self) -> None:
+        pass
+
+
+class ChunkedPort(FakePort):
+    """
+    Delivers the reply in the given chunks, one per poll; an empty chunk is a poll
+    that finds nothing waiting.
+    """
+
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = list(chunks)
+        self.reads = []
+
+    @property
+    def in_waiting(self) -> int:
+        if self.chunks and not self.chunks[0]:
+            self.chunks.pop(0)
+            return 0
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def read(self, size: int) -> bytes:
+        self.reads.append(size)
+        return self.chunks.pop(0)
+
+
+def _make_communicator(port: FakePort) -> GaugeCommunicator:
+    communicator = GaugeCommunicator("TEST", "PPG550")
+    communicator.ser = port
+    return communicator
+
+
+class RS485ModeTest(unittest.TestCase):
+    def test_rejected_native_mode_is_cleared_and_not_retried(self):
+        port = FakePort(rs485_error=OSError("Inappropriate ioctl for device"))
+        communicator = _make_communicator(port)
+        communicator.set_rs_mode("RS485")
+        communicator.set_rs_mode("RS485")
+        self.assertIsNone(port.rs485_mode)
+        self.assertEqual(len([s for s in port.rs485_assignments if s is not None]), 1)
+        self.assertFalse(communicator._rs485_native)
+
+    def test_switching_to_rs232_clears_kernel_rs485(self):
+        port = FakePort()
+        communicator = _make_communicator(port)
+        with mock.patch.object(gauge_communicator, "fcntl") as fcntl:
+            communicator.set_rs_mode("RS485")
+            self.assertTrue(communicator._rs485_native)
+            communicator.set_rs_mode("RS232")
+        fcntl.ioctl.assert_called_once()
+        fd, request, buf = fcntl.ioctl.call_args[0]
+        self.assertEqual((fd, request), (99, gauge_communicator._TIOCSRS485))
+        self.assertEqual(list(buf), [0] * 8)
+        self.assertIsNone(port.rs485_mode)
+        self.assertFalse(communicator._rs485_native)
+
+    def test_settings_changes_apply_rs485_once_per_open_port(self):
+        port = FakePort()
+        communicator = _make_communicator(port)
+        settings = {"baudrate": 9600, "bytesize": 8, "parity": "N", "stopbits": 1, "rs485_mode": True}
+        communicator.apply_serial_settings(settings)
+        communicator.apply_serial_settings({**settings, "baudrate": 19200})
+        self.assertEqual(len([s for s in port.rs485_assignments if s is not None]), 1)
+        reopened = FakePort()
+        with mock.patch.object(gauge_communicator.serial, "Serial", return_value=reopened):
+            communicator.open_port()
+        self.assertEqual(len([s for s in reopened.rs485_assignments if s is not None]), 1)
+
+    def test_failed_disable_keeps_native_mode_recorded(self):
+        port = FakePort()
+        communicator = _make_communicator(port)
+        with mock.patch.object(gauge_communicator, "fcntl") as fcntl:
+            communicator.set_rs_mode("RS485")
+            fcntl.ioctl.side_effect = OSError("I/O error")
+            with self.assertRaises(OSError):
+                communicator.set_rs_mode("RS232")
+        self.assertTrue(communicator._rs485_native)
+
+
+class OutputFormatTest(unittest.TestCase):
+    def test_unknown_format_is_rejected(self):
+        communicator = _make_communicator(FakePort())
+        communicator.set_output_format("Hex")
+        communicator.set_output_format("Octal")
+        self.assertEqual(communicator.output_format, "Hex")
+        self.assertEqual(communicator.response_handler.output_format, "Hex")
+
+
+class ReadResponseTest(unittest.TestCase):
+    def test_terminated_reply_is_read_in_chunks(self):
+        port = ChunkedPort([b"@ACK1.0", b"E-3;FF\\", b"extra"])
+        communicator = _make_communicator(port)
+        self.assertEqual(communicator.read_response(), b"@ACK1.0E-3;FF\\")
+        self.assertEqual(port.reads, [7, 7])
+
+    def test_nak_reply_waits_for_the_terminator(self):
+        port = ChunkedPort([b"@NAK", b"", b"", b"12;FF\\"])
+        communicator = _make_communicator(port)
+        self.assertEqual(communicator.read_response(), b"@NAK12;FF\\")
+
+    def test_unterminated_reply_ends_when_input_stops(self):
+        port = ChunkedPort([b"\x01\x02", b"\x03", b"", b"\x04"])
+        communicator = _make_communicator(port)
+        communicator.protocol = object()
+        self.assertEqual(communicator.read_response(), b"\x01\x02\x03")
+        self.assertEqual(port.reads, [2, 1])
+
+
+class ManualCommandTest(unittest.TestCase):
+    def test_manual_rs485_switches_rts_through_pyserial(self):
+        port = FakePort(rs485_error=OSError("Inappropriate ioctl for device"))
+        communicator = _make_communicator(port)
+        communicator.rts_delay = communicator.rts_delay_before_tx = communicator.rts_delay_before_rx = 0
+        communicator.set_rs_mode("RS485")
+        del port.rts_levels[:]
+        result = IntelligentCommandSender.send_manual_command(communicator, "01 02")
+        self.assertTrue(result["success"])
+        self.assertEqual(port.rts_levels, [communicator.rts_level_for_tx, communicator.rts_level_for_rx])
+
+    def test_rts_released_after_the_write_drains(self):
+        port = FakePort(rs485_error=OSError("Inappropriate ioctl for device"))
+        communicator = _make_communicator(port)
+        communicator.rts_delay, communicator.rts_delay_before_tx, communicator.rts_delay_before_rx = 0.01, 0, 0.02
+        communicator.set_rs_mode("RS485")
+        del port.rts_levels[:]
+        flushed_at = []
+        port.flush = lambda: flushed_at.append(len(port.rts_levels))
+        with mock.patch.object(intelligent_command_sender.time, "sleep") as sleep:
+            IntelligentCommandSender.send_manual_command(communicator, "01 02")
+        self.assertEqual(flushed_at, [1])
+        self.assertAlmostEqual(sleep.call_args_list[0][0][0], 0.03)
+
+    def test_closed_or_missing_port(self):
+        port = FakePort()
+        port.is_open = False
+        communicator = _make_communicator(port)
+        self.assertEqual(IntelligentCommandSender.send_manual_command(communicator, "01")["error"], "Port not open")
+        communicator.ser = None
+        self.assertEqual(IntelligentCommandSender.send_manual_command(communicator, "01")["error"], "Port not open")
+
+    def _send_twice(self, between=None):
+        port = FakePort()
+        communicator = _make_communicator(port)
+        communicator.rts_delay = 0
+        with mock.patch.object(intelligent_command_sender, "termios", None):
+            IntelligentCommandSender.send_manual_command(communicator, "01 02")
+            if between:
+                between(port, communicator)
+            IntelligentCommandSender.send_manual_command(communicator, "01 02")
+        return port
+
+    def test_flush_skipped_after_a_clean_exchange(self):
+        self.assertEqual(self._send_twice().input_resets, 1)
+
+    def test_flush_kept_when_input_is_pending(self):
+        port = self._send_twice(lambda port, communicator: port.input.extend(b"\x99"))
+        self.assertEqual(port.input_resets, 2)
+
+    def test_flush_kept_after_continuous_reading(self):
+        port = self._send_twice(lambda port, communicator: communicator.set_continuous_reading(True))
+        self.assertEqual(port.input_resets, 2)
+
+
+class GaugeTesterTest(unittest.TestCase):
+    def test_run_all_tests_encodes_commands_on_the_calling_thread(self):
+        communicator = GaugeCommunicator("TEST", "PCG550")
+        communicator.ser = FakePort()
+        communicator.rts_delay = 0
+        protocol = communicator.protocol
+        threads = []
+        create_command = protocol.create_command
+
+        def recording_create_command(command):
+            threads.append(threading.current_thread())
+            return create_command(command)
+
+        protocol.create_command = recording_create_command
+        tester = GaugeTester(communicator, logging.getLogger("GaugeTesterTest"))
+        results = tester.run_all_tests()
+        self.assertEqual(set(results["commands_tested"]), set(tester.test_commands))
+        self.assertEqual(threads, [threading.current_thread()] * len(tester.test_commands))
+
+    def test_command_builders_per_gauge_type(self):
+        info = {"pid": 208, "cmd": 1}
+        pcg = GaugeTester._BUILDERS["MPG500"]("product_name", info)
+        self.assertEqual((pcg.name, pcg.command_type, pcg.parameters), ("product_name", "?", info))
+        ppg = GaugeTester._BUILDERS["PPG550"]("product_name", {"cmd": "PRD", "type": "read"})
+        self.assertEqual((ppg.name, ppg.command_type), ("PRD", "?"))
+        self.assertNotIn("CDG045D", GaugeTester._BUILDERS)
+        cdg = gauge_tester._build_default("gauge_type", {"cmd": "read", "name": "cdg_type"})
+        self.assertEqual((cdg.name, cdg.command_type), ("cdg_type", "read"))
+
+    def test_baud_scan_stops_after_max_attempts(self):
+        tester = GaugeTester(_make_communicator(FakePort()), logging.getLogger("GaugeTesterTest"))
+        with mock.patch.object(GaugeCommunicator, "open_port", side_effect=OSError("no port")) as open_port, \
+                mock.patch.object(gauge_tester.time, "sleep"):
+            self.assertFalse(tester.try_all_baud_rates("TEST", max_attempts=2))
+        self.assertEqual(open_port.call_count, 2)
+
+    def test_baud_scan_stops_at_the_deadline(self):
+        tester = GaugeTester(_make_communicator(FakePort()), logging.getLogger("GaugeTesterTest"))
+        clock = [0.0]
+
+        def slow_open_port():
+            clock[0] += 6.0
+            raise OSError("no port")
+
+        fake_time = SimpleNamespace(monotonic=lambda: clock[0], sleep=lambda seconds: None)
+        with mock.patch.object(GaugeCommunicator, "open_port", side_effect=slow_open_port) as open_port, \
+                mock.patch.object(gauge_tester, "time", fake_time):
+            self.assertFalse(tester.try_all_baud_rates("TEST", timeout_s=10.0))
+        self.assertEqual(open_port.call_count, 2)
+
+    def test_probe_read_rejects_garbled_bytes_early(self):
+        communicator = _make_communicator(FakePort())
+        tester = GaugeTester(communicator, logging.getLogger("GaugeTesterTest"))
+        communicator.ser.input.extend(b"\xfe\x80\xff")
+        start = time.monotonic()
+        self.assertIsNone(tester._fast_probe_read(communicator.ser, communicator.protocol, max_wait=5.0))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_probe_read_returns_plausible_reply(self):
+        communicator = _make_communicator(FakePort())
+        tester = GaugeTester(communicator, logging.getLogger("GaugeTesterTest"))
+        communicator.ser.input.extend(b"@ACK1.0E-3;FF")
+        self.assertEqual(tester._fast_probe_read(communicator.ser, communicator.protocol), b"@ACK1.0E-3;FF")
+
+    def test_plausibility_per_protocol(self):
+        cdg = GaugeCommunicator("TEST", "CDG045D").protocol
+        mpg = GaugeCommunicator("TEST", "MPG500").protocol
+        self.assertTrue(GaugeTester._is_plausible_response(bytearray(b"\x07\x00"), cdg))
+        self.assertFalse(GaugeTester._is_plausible_response(bytearray(b"\x08\x00"), cdg))
+        self.assertTrue(GaugeTester._is_plausible_response(bytearray(b"\x00\x04"), mpg))
+        self.assertFalse(GaugeTester._is_plausible_response(bytearray(b"\x00\x14"), mpg))
+
+
+if __name__ == "__main__":
+    unittest.main()
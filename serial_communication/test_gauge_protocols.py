@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+test_gauge_protocols.py
+
+Unit tests for the gauge protocol classes and the command tables they share.
+Run with: python -m unittest serial_communication.test_gauge_protocols
+"""
+
+import dataclasses
+import math
+import os
+import subprocess
+import sys
+import unittest
+
+from serial_communication import gauges
+from serial_communication.communicator.protocol_factory import get_protocol
+from serial_communication.gauges import commands
+from serial_communication.gauges.commands import get_command_class
+from serial_communication.gauges.commands.cdg_commands import CDGCommand
+from serial_communication.gauges.commands.magmpg_commands import MAG500Command, MPG500Command
+from serial_communication.gauges.commands.pcg550_commands import PCG550Command
+from serial_communication.gauges.commands.pfeiffer_commands import PfeifferCommonCommands
+from serial_communication.gauges.protocols.bcg450_protocol import BCG450Protocol
+from serial_communication.gauges.protocols.gauge_protocol import LN10_OVER_2_26, decode_s32
+from serial_communication.gauges.protocols.magmpg_protocol import MAGMPGProtocol
+from serial_communication.models import GaugeCommand
+from serial_communication.param_types import CommandDefinition
+
+
+class CommandSetTest(unittest.TestCase):
+    def test_tables_follow_declaration_order(self):
+        self.assertEqual(MAG500Command.commands[0], MAG500Command.PRESSURE)
+        self.assertIs(MAG500Command.by_name["ccig_status"], MAG500Command.CCIG_STATUS)
+        self.assertIs(MAG500Command.by_pid[533], MAG500Command.CCIG_STATUS)
+
+    def test_first_definition_wins_for_repeated_pids(self):
+        # ZERO_ADJUST and FILTER share PID 0x02.
+        self.assertIs(CDGCommand.by_pid[0x02], CDGCommand.ZERO_ADJUST)
+        self.assertIs(CDGCommand.by_name["filter"], CDGCommand.FILTER)
+
+    def test_inherited_commands_come_first(self):
+        common = PfeifferCommonCommands.commands
+        self.assertEqual(PCG550Command.commands[:len(common)], common)
+        self.assertIs(PCG550Command.by_name["serial_number"], PfeifferCommonCommands.SERIAL_NUMBER)
+        self.assertIs(PCG550Command.by_name["zero_adjust"], PCG550Command.ZERO_ADJUST)
+        self.assertNotIn("zero_adjust", PfeifferCommonCommands.by_name)
+
+    def test_definitions_are_immutable_values(self):
+        definition = CommandDefinition(221, "".join(["pres", "sure"]), "Read pressure", True)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            definition.pid = 1
+        self.assertIs(definition.name, sys.intern("pressure"))
+        self.assertEqual(definition, CommandDefinition(221, "pressure", "Read pressure", True))
+        self.assertEqual(len({definition, CommandDefinition(221, "pressure", "Read pressure", True)}), 1)
+
+    def test_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            MAG500Command.by_name["pressure"] = None
+
+
+class Crc16Test(unittest.TestCase):
+    @staticmethod
+    def _bitwise_crc16(data: bytes) -> int:
+        crc = 0xFFFF
+        for byte in data:
+            crc ^= byte << 8
+            for _ in range(8):
+                crc = ((crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1) & 0xFFFF
+        return crc
+
+    def test_matches_the_bitwise_ccitt_crc(self):
+        protocol = BCG450Protocol()
+        self.assertEqual(protocol.calculate_crc16(b"123456789"), 0x29B1)
+        for data in (b"", b"\x00", b"\xff" * 7, bytes(range(256))):
+            with self.subTest(data=data[:8]):
+                self.assertEqual(protocol.calculate_crc16(data), self._bitwise_crc16(data))
+        self.assertEqual(protocol.calculate_crc16(memoryview(b"\x01\x02")), self._bitwise_crc16(b"\x01\x02"))
+
+
+class DecodeS32Test(unittest.TestCase):
+    def test_four_byte_payloads(self):
+        self.assertEqual(decode_s32(b"\x00\x00\x01\x00"), 256)
+        self.assertEqual(decode_s32(b"\xff\xff\xff\xfe"), -2)
+        self.assertEqual(decode_s32(bytearray(b"\x80\x00\x00\x00")), -(1 << 31))
+
+    def test_other_lengths_match_int_from_bytes(self):
+        for data in (b"", b"\xff", b"\x01\x02", b"\xff\x00\x00\x00\x01"):
+            with self.subTest(data=data):
+                self.assertEqual(decode_s32(data), int.from_bytes(data, "big", signed=True))
+
+
+class LogFixs32en26Test(unittest.TestCase):
+    def test_exp_matches_power_of_ten(self):
+        for value in (-11 << 26, -3 << 26, -1, 0, 1, 12345678, 3 << 26):
+            with self.subTest(value=value):
+                self.assertAlmostEqual(math.exp(value * LN10_OVER_2_26) / 10 ** (value / (1 << 26)), 1.0, places=12)
+
+    def test_bcg450_pressure_and_temperature_text(self):
+        protocol = BCG450Protocol()
+        protocol.create_command(GaugeCommand(name="pressure", command_type="?"))
+        response = protocol.parse_response((-3 << 26).to_bytes(4, "big", signed=True))
+        self.assertEqual(response.formatted_data, "{'pressure': '1.00e-03 mbar'}")
+        protocol.create_command(GaugeCommand(name="temperature", command_type="?"))
+        # 35 / 100.0 rounds to 0.3, while 35 * 0.01 would display 0.4.
+        response = protocol.parse_response((35).to_bytes(4, "big", signed=True))
+        self.assertEqual(response.formatted_data, "{'temperature': '0.3°C'}")
+
+
+class BCG450CommandTest(unittest.TestCase):
+    @staticmethod
+    def _expected(protocol, body):
+        crc = protocol.calculate_crc16(bytes(body))
+        return bytes(body) + bytes([crc & 0xFF, crc >> 8])
+
+    def test_read_frame(self):
+        protocol = BCG450Protocol()
+        frame = protocol.create_command(GaugeCommand(name="pressure", command_type="?"))
+        self.assertEqual(frame, self._expected(protocol, [0x00, 0x0B, 0x00, 0x05, 0x01, 0x00, 221, 0x00, 0x00]))
+
+    def test_write_frame_with_parameter_over_rs485(self):
+        protocol = BCG450Protocol(address=7)
+        protocol.rs485_mode = True
+        command = GaugeCommand(name="ba_degas", command_type="!", parameters={"value": "300"})
+        frame = protocol.create_command(command)
+        # 300 is truncated to its low byte, and the length field grows by one.
+        self.assertEqual(frame, self._expected(protocol, [7, 0x0B, 0x00, 0x06, 0x03, 0x02, 0x11, 0x00, 0x00, 44]))
+        self.assertIs(protocol.create_command(command), frame)
+
+    def test_cached_frames_follow_the_address(self):
+        protocol = BCG450Protocol(address=1)
+        command = GaugeCommand(name="temperature", command_type="?")
+        self.assertEqual(protocol.create_command(command)[0], 0x00)
+        protocol.rs485_mode = True
+        self.assertEqual(protocol.create_command(command)[0], 1)
+        protocol.address = 2
+        self.assertEqual(protocol.create_command(command)[0], 2)
+
+
+class BCG450ResponseTest(unittest.TestCase):
+    def _parse(self, name, data):
+        protocol = BCG450Protocol()
+        protocol.create_command(GaugeCommand(name=name, command_type="?"))
+        return protocol.parse_response(data).formatted_data
+
+    def test_status_handler(self):
+        self.assertEqual(self._parse("sensor_status", b"\x09"),
+                         "{'status': {'pirani': 'ACTIVE', 'ba': 'INACTIVE', 'degas': 'ON'}}")
+
+    def test_control_handler(self):
+        self.assertEqual(self._parse("pirani_adjust", b"\x00"), "{'result': 'Command executed successfully'}")
+
+    def test_unhandled_types_fall_back_to_raw_hex(self):
+        self.assertEqual(self._parse("serial_number", b"\x0a\xbc"), "{'value': '0A BC'}")
+
+
+class GetCommandClassTest(unittest.TestCase):
+    def test_lookup(self):
+        self.assertIs(get_command_class("CDG025D"), CDGCommand)
+        self.assertIsNone(get_command_class("PPG550"))
+
+    def test_gauges_package_re_exports_the_same_objects(self):
+        self.assertIs(gauges.GAUGE_COMMAND_MAP, commands.GAUGE_COMMAND_MAP)
+        self.assertIs(gauges.get_command_class, commands.get_command_class)
+
+    def test_unknown_type_raises_every_time(self):
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, "Unknown gauge type: XYZ"):
+                get_command_class("XYZ")
+
+
+class MAGMPGProtocolTest(unittest.TestCase):
+    def test_mag500_construction(self):
+        protocol = MAGMPGProtocol(device_id=0x14)
+        self.assertIs(protocol._command_defs, MAG500Command.by_name)
+        frame = protocol.create_command(GaugeCommand(name="ccig_status", command_type="?"))
+        self.assertEqual(frame[1], 0x14)
+
+    def test_mpg500_construction(self):
+        protocol = MAGMPGProtocol(device_id=0x04)
+        self.assertIs(protocol._command_defs, MPG500Command.by_name)
+        frame = protocol.create_command(GaugeCommand(name="active_sensor", command_type="?"))
+        self.assertEqual(frame[1], 0x04)
+        self.assertEqual((frame[5] << 8) | frame[6], 223)
+
+
+class ProtocolFactoryTest(unittest.TestCase):
+    def test_device_id_defaults_per_gauge_type(self):
+        self.assertEqual(get_protocol("MAG500", {}).device_id, 0x14)
+        self.assertEqual(get_protocol("MPG500", {}).device_id, 0x04)
+        self.assertEqual(get_protocol("MPG500", {"device_id": 0x05}).device_id, 0x05)
+
+    def test_constructor_arguments_per_gauge_type(self):
+        ppg = get_protocol("PPG570", {"address": 3})
+        self.assertEqual((ppg.address, ppg.gauge_type, ppg.has_atm), (3, "PPG570", True))
+        self.assertEqual(get_protocol("PSG550", {}).device_id, 0x02)
+        self.assertEqual(get_protocol("BCG450", {"address": 3, "device_id": 9}).address, 254)
+
+    def test_protocol_class_per_gauge_type(self):
+        self.assertIsInstance(get_protocol("MPG500", {}), MAGMPGProtocol)
+
+    def test_each_call_returns_a_new_protocol(self):
+        first = get_protocol("BCG450", {})
+        first.rs485_mode = True
+        second = get_protocol("BCG450", {})
+        self.assertIsNot(first, second)
+        self.assertFalse(second.rs485_mode)
+
+    def test_protocol_modules_load_on_first_use(self):
+        code = (
+            "import sys\n"
+            "from serial_communication.communicator.protocol_factory import get_protocol\n"
+            "get_protocol('PPG550', {})\n"
+            "print(sorted(m.rsplit('.', 1)[1] for m in sys.modules if '.protocols.' in m))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        loaded = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True,
+                                check=True).stdout
+        self.assertEqual(loaded.strip(), "['gauge_protocol', 'ppg_protocol']")
+
+    def test_unknown_gauge_type(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported gauge type: XYZ"):
+            get_protocol("XYZ", {})
+
+
+if __name__ == "__main__":
+    unittest.main()
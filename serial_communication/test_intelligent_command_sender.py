@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+test_intelligent_command_sender.py
+
+Unit tests for IntelligentCommandSender's input detection and byte conversion.
+Run with: python -m unittest serial_communication.test_intelligent_command_sender
+"""
+
+import unittest
+
+from serial_communication.communicator import intelligent_command_sender
+from serial_communication.communicator.intelligent_command_sender import IntelligentCommandSender
+
+
+class ConvertToBytesTest(unittest.TestCase):
+    def test_binary_is_padded_to_whole_bytes(self):
+        self.assertEqual(IntelligentCommandSender.convert_to_bytes("binary", "1000000101"), b"\x81\x40")
+
+    def test_binary_keeps_leading_zero_bytes(self):
+        self.assertEqual(IntelligentCommandSender.convert_to_bytes("binary", "000000001"), b"\x00\x80")
+        self.assertEqual(IntelligentCommandSender.convert_to_bytes("binary", ""), b"")
+
+    def test_decimal_fields(self):
+        self.assertEqual(IntelligentCommandSender.convert_to_bytes("decimal_csv", " 1, 2 ,255"), b"\x01\x02\xff")
+        self.assertEqual(IntelligentCommandSender.convert_to_bytes("decimal", "1  2\t3"), b"\x01\x02\x03")
+
+    def test_malformed_input_raises_value_error(self):
+        cases = [
+            ("binary", "-101"),
+            ("binary", "1_0"),
+            ("hex", "0g"),
+            ("decimal", "256"),
+            ("ascii", "é"),
+            ("octal", "17"),
+        ]
+        for format_type, text in cases:
+            with self.subTest(format_type=format_type, text=text):
+                with self.assertRaises(ValueError):
+                    IntelligentCommandSender.convert_to_bytes(format_type, text)
+
+    def test_detected_formats_round_trip(self):
+        cases = {
+            "0x01 0x02": b"\x01\x02",
+            "\\x41\\x42": b"AB",
+            "1, 2, 3": b"\x01\x02\x03",
+            "0100 0001": b"A",
+            "300 1": None,
+            "hello": b"hello",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                format_type, normalized = IntelligentCommandSender.detect_format(text)
+                if expected is None:
+                    with self.assertRaises(ValueError):
+                        IntelligentCommandSender.convert_to_bytes(format_type, normalized)
+                else:
+                    self.assertEqual(IntelligentCommandSender.convert_to_bytes(format_type, normalized), expected)
+
+
+
+class FormatOutputSuggestionTest(unittest.TestCase):
+    def test_printable_text_is_ascii(self):
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"@ACK1.0E-3;FF\r\n"), "ASCII")
+
+    def test_control_bytes_are_not_ascii(self):
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"AB\x00"), "Decimal")
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"A\x7f"), "Hex")
+
+    def test_empty_or_high_bit_responses_are_hex(self):
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b""), "Hex")
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"caf\xe9"), "Hex")
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"\x01\x80"), "Hex")
+
+    def test_decimal_threshold(self):
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"\x01\x63"), "Decimal")
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"\x01\x64"), "Hex")
+
+    def test_tab_is_not_printable(self):
+        self.assertEqual(IntelligentCommandSender.format_output_suggestion(b"\t1"), "Decimal")
+
+
+
+class DetectFormatTest(unittest.TestCase):
+    def assertDetected(self, text, expected):
+        self.assertEqual(IntelligentCommandSender.detect_format(text), expected)
+
+    def test_full_string_classification(self):
+        self.assertDetected(" 0101 1 ", ("binary", "01011"))
+        self.assertDetected("12  34", ("decimal", "12  34"))
+        self.assertDetected("1A 2b", ("hex", "1A2b"))
+        self.assertDetected("12 3g", ("ascii", "12 3g"))
+        self.assertDetected("1\n2", ("decimal", "1\n2"))
+
+    def test_prefixes_and_separators_are_stripped(self):
+        self.assertDetected("0x01 0XaB", ("hex_prefixed", "01aB"))
+        self.assertDetected("\\x41 \\x42", ("hex_escaped", "4142"))
+        # Only the '0x' pairs go; a 0 followed by other digits is kept.
+        self.assertDetected("0x00 0x10", ("hex_prefixed", "0010"))
+
+    def test_uppercase_prefix_anywhere(self):
+        format_type, normalized = IntelligentCommandSender.detect_format("AB 0X01")
+        self.assertEqual(format_type, "hex_prefixed")
+        self.assertEqual(IntelligentCommandSender.convert_to_bytes(format_type, normalized), b"\xab\x01")
+
+    def test_comma_inputs(self):
+        self.assertDetected("1, 0,1", ("decimal_csv", "1, 0,1"))
+        self.assertDetected("ab,cd", ("ascii", "ab,cd"))
+        self.assertDetected("1,", ("ascii", "1,"))
+
+
+
+class MemoizationTest(unittest.TestCase):
+    def test_repeated_commands_hit_the_cache(self):
+        intelligent_command_sender._detect_format.cache_clear()
+        intelligent_command_sender._convert_to_bytes.cache_clear()
+        for _ in range(3):
+            command = IntelligentCommandSender.convert_to_bytes(*IntelligentCommandSender.detect_format("0x01 0x02"))
+        self.assertEqual(command, b"\x01\x02")
+        self.assertEqual(intelligent_command_sender._detect_format.cache_info().hits, 2)
+        self.assertEqual(intelligent_command_sender._convert_to_bytes.cache_info().hits, 2)
+
+    def test_failures_are_raised_every_time(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                IntelligentCommandSender.convert_to_bytes("hex", "zz")
+
+
+if __name__ == "__main__":
+    unittest.main()
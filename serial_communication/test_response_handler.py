@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+test_response_handler.py
+
+Unit tests for ResponseHandler formatting and frame parsing.
+Run with: python -m unittest serial_communication.test_response_handler
+"""
+
+import json
+import unittest
+
+from serial_communication.communicator.response_handler import ResponseHandler
+
+
+class CreateGaugeResponseTest(unittest.TestCase):
+    def test_formats_with_the_active_output_format(self):
+        handler = ResponseHandler("Hex")
+        response = handler.create_gauge_response(b"\x01\xff")
+        handler.set_output_format("Decimal")
+        self.assertEqual(response.formatted_data, "01 ff")
+
+    def test_keeps_preformatted_data(self):
+        response = ResponseHandler("Hex").create_gauge_response(b"\x01", formatted_data="one")
+        self.assertEqual(response.formatted_data, "one")
+
+    def test_empty_response(self):
+        response = ResponseHandler().create_gauge_response(b"", success=False, error_message="timeout")
+        self.assertEqual(response.formatted_data, "No response")
+        self.assertFalse(response.success)
+
+
+class ProcessCdgFrameTest(unittest.TestCase):
+    # Status 0xE0: heating, temperature OK and emission on, unit 2; pressure 1.0.
+    FRAME = bytes([0x07, 0x00, 0xE0, 0x00, 0x40, 0x00, 0x00, 0x0A, 0x2A])
+
+    def test_decodes_frame(self):
+        result = ResponseHandler.process_cdg_frame(self.FRAME)
+        self.assertEqual(result["pressure"], 1.0)
+        self.assertTrue(result["checksum_valid"])
+        self.assertEqual(result["status"], {"unit": 2, "heating": True, "temp_ok": True, "emission": True})
+
+    def test_every_field_is_unpacked(self):
+        frame = bytes([0x07, 0x01, 0x00, 0x02, 0x00, 0x10, 0x03, 0x0A, 0x20])
+        result = ResponseHandler.process_cdg_frame(frame)
+        self.assertEqual(
+            {key: result[key] for key in ("start_byte", "page_no", "error", "read_value", "sensor_type", "checksum")},
+            {"start_byte": 0x07, "page_no": 0x01, "error": 0x02, "read_value": 0x03, "sensor_type": 0x0A,
+             "checksum": 0x20},
+        )
+
+    def test_checksum_mismatch(self):
+        for index in (1, 4, 5, 7, 8):
+            with self.subTest(index=index):
+                frame = bytearray(self.FRAME)
+                frame[index] ^= 0x01
+                self.assertFalse(ResponseHandler.process_cdg_frame(bytes(frame))["checksum_valid"])
+
+    def test_frame_inside_a_larger_buffer(self):
+        buffer = bytearray(b"\xff\xff" + self.FRAME + b"\x07")
+        view = memoryview(buffer)[2:11]
+        self.assertEqual(ResponseHandler.process_cdg_frame(view), ResponseHandler.process_cdg_frame(self.FRAME))
+        self.assertEqual(ResponseHandler.process_cdg_frame(memoryview(buffer)[2:10]), {"error": "Invalid frame length"})
+
+    def test_callable_without_an_instance(self):
+        self.assertEqual(ResponseHandler.process_cdg_frame(self.FRAME), ResponseHandler().process_cdg_frame(self.FRAME))
+
+    def test_negative_pressure(self):
+        frame = bytes([0x07, 0x00, 0x00, 0x00, 0xC0, 0x00, 0x00, 0x0A, 0xCA])
+        result = ResponseHandler.process_cdg_frame(frame)
+        self.assertEqual(result["pressure"], -1.0)
+        self.assertTrue(result["checksum_valid"])
+
+    def test_status_is_a_private_dict(self):
+        first = ResponseHandler.process_cdg_frame(self.FRAME)
+        first["status"]["unit"] = 0
+        second = ResponseHandler.process_cdg_frame(self.FRAME)
+        self.assertEqual(second["status"]["unit"], 2)
+        json.dumps(second)
+
+    def test_error_results_are_private_dicts(self):
+        result = ResponseHandler.process_cdg_frame(b"\x07")
+        result["error"] = "changed"
+        self.assertEqual(ResponseHandler.process_cdg_frame(b"\x07"), {"error": "Invalid frame length"})
+
+
+class ParsePpgResponseTest(unittest.TestCase):
+    def test_parses_ack(self):
+        self.assertEqual(ResponseHandler.parse_ppg_response(b"@ACK1.0E-3,0;FF\r"),
+                         {"data": "1.0E-3,0", "values": ["1.0E-3", "0"]})
+
+    def test_framing_is_checked_after_stripping_whitespace(self):
+        self.assertEqual(ResponseHandler.parse_ppg_response(b"\x1c @253;FF\r\n"), {"data": "253", "values": ["253"]})
+        self.assertEqual(ResponseHandler.parse_ppg_response(b"@NAK160;FF"), {"error": "Command failed: 160"})
+        self.assertEqual(ResponseHandler.parse_ppg_response(b"@ACK\xb5;FF")["data"], "\ufffd")
+
+    def test_error_results_are_private_dicts(self):
+        result = ResponseHandler.parse_ppg_response(b"garbage")
+        result["error"] = "changed"
+        self.assertEqual(ResponseHandler.parse_ppg_response(b"garbage"), {"error": "Invalid response format"})
+
+
+
+class FormatResponseTest(unittest.TestCase):
+    def _format(self, output_format, response):
+        return ResponseHandler(output_format).format_response(response)
+
+    def test_table_formats(self):
+        self.assertEqual(self._format("Hex", b"\x00\xab\x10"), "00 ab 10")
+        self.assertEqual(self._format("Binary", b"\x05\xff"), "00000101 11111111")
+        self.assertEqual(self._format("Decimal", b"\x00\x7f\xff"), "0 127 255")
+
+    def test_text_and_fallback_formats(self):
+        self.assertEqual(self._format("ASCII", b"OK\xff"), "OK\ufffd")
+        self.assertEqual(self._format("UTF-8", "µ".encode("utf-8")), "µ")
+        self.assertEqual(self._format("Raw Bytes", b"\x01A"), "b'\\x01A'")
+
+    def test_no_format_fails_on_any_byte(self):
+        every_byte = bytes(range(256))
+        for output_format in ("Hex", "Binary", "ASCII", "UTF-8", "Decimal", "Raw Bytes"):
+            with self.subTest(output_format=output_format):
+                self.assertEqual(self._format(output_format, b""), "No response")
+                self.assertIsInstance(self._format(output_format, every_byte), str)
+
+    def test_handler_is_slotted(self):
+        handler = ResponseHandler()
+        self.assertFalse(hasattr(handler, "__dict__"))
+        with self.assertRaises(AttributeError):
+            handler.outputformat = "Hex"
+
+    def test_switching_format_switches_formatter(self):
+        handler = ResponseHandler("Hex")
+        handler.output_format = "Decimal"
+        self.assertEqual(handler.format_response(b"\x0a"), "10")
+
+
+
+class SuggestFormatTest(unittest.TestCase):
+    def test_classification(self):
+        handler = ResponseHandler()
+        self.assertEqual(handler.suggest_format(b"@ACK;FF\r\n"), "ASCII")
+        self.assertEqual(handler.suggest_format(b"\x07\x63"), "Decimal")
+        self.assertEqual(handler.suggest_format(b"\x07\x64"), "Hex")
+        self.assertEqual(handler.suggest_format(b"\t"), "Decimal")
+
+    def test_empty_or_high_bit_responses_are_hex(self):
+        handler = ResponseHandler()
+        self.assertEqual(handler.suggest_format(b""), "Hex")
+        self.assertEqual(handler.suggest_format(b"OK\x80"), "Hex")
+        self.assertEqual(handler.suggest_format(b"\x01\xff"), "Hex")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+test_turbo_serial_manager.py
+
+Unit tests for configure_turbo_serial, with serial.Serial replaced by a stand-in.
+Run with: python -m unittest serial_communication.test_turbo_serial_manager
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from serial_communication.communicator import turbo_serial_manager
+
+
+class ConfigureTurboSerialTest(unittest.TestCase):
+    def test_each_port_gets_its_own_rs485_settings(self):
+        with mock.patch.object(turbo_serial_manager.serial, "Serial", side_effect=lambda **kw: SimpleNamespace()):
+            first = turbo_serial_manager.configure_turbo_serial("A", 9600, use_rs485=True)
+            second = turbo_serial_manager.configure_turbo_serial("B", 9600, use_rs485=True)
+        self.assertIsNot(first.rs485_mode, second.rs485_mode)
+        first.rs485_mode.delay_before_tx = 0.5
+        self.assertEqual(second.rs485_mode.delay_before_tx, 0.005)
+
+
+if __name__ == "__main__":
+    unittest.main()
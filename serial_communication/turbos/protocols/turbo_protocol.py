@@ -11,6 +11,7 @@ All turbo-specific protocols must implement methods for:
 This file ensures that turbo protocols share a consistent interface.
 """
 
+import binascii
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 import logging
@@ -75,16 +76,8 @@ class TurboProtocol(ABC):
         Returns:
             int: The 16-bit checksum.
         """
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= (byte << 8)
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021
-                else:
-                    crc <<= 1
-            crc &= 0xFFFF
-        return crc
+        # binascii.crc_hqx is the CCITT polynomial 0x1021, MSB first, computed in C.
+        return binascii.crc_hqx(data, 0xFFFF)
 
     def set_rs485_mode(self, enabled: bool) -> None:
         """